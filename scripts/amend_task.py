@@ -16,8 +16,6 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Set
 
-import typer
-
 # Add the project root to the path
 project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
@@ -374,9 +372,10 @@ def extract_task_sections(content: str) -> Dict[str, List[str]]:
         section_content = content[start_pos:end_pos].strip()
         sections[header] = section_content
     
-    # Extract task subsections
-    task_pattern = r"^(###\s+Task\s+\d+:.+?)(?=###\s+Task|$)"
-    task_matches = re.finditer(task_pattern, content, re.MULTILINE | re.DOTALL)
+    # Extract task subsections. With MULTILINE, $ already stops the match at
+    # the end of the heading line, so DOTALL only added backtracking work.
+    task_pattern = r"^(###\s+Task\s+\d+:[^\n]+?)(?=###\s+Task|$)"
+    task_matches = re.finditer(task_pattern, content, re.MULTILINE)
     
     tasks = {}
     for m in task_matches:
@@ -755,6 +754,35 @@ def ensure_checkboxes(content: str) -> str:
     return re.sub(step_pattern, replace_step, content, flags=re.MULTILINE)
 
 
+def amend_task_content(content: str) -> str:
+    """
+    Amend task list markdown in memory to conform to the template guide.
+    
+    Args:
+        content: The markdown content to amend.
+        
+    Returns:
+        The amended markdown content.
+    """
+    # Check required sections
+    missing_sections = check_required_sections(content)
+    
+    # First add execution info to existing tasks
+    content = add_execution_info(content)
+    
+    # Then add missing sections
+    if missing_sections:
+        content = add_missing_sections(content, missing_sections)
+    
+    # Ensure status markers
+    content = ensure_status_markers(content)
+    
+    # Ensure checkboxes
+    content = ensure_checkboxes(content)
+    
+    return content
+
+
 def amend_task_list(markdown_path: str, output_path: Optional[str] = None) -> str:
     """
     Amend a task list to conform to the template guide.
@@ -771,21 +799,7 @@ def amend_task_list(markdown_path: str, output_path: Optional[str] = None) -> st
         with open(markdown_path, 'r', encoding='utf-8') as file:
             content = file.read()
         
-        # Check required sections
-        missing_sections = check_required_sections(content)
-        
-        # First add execution info to existing tasks
-        content = add_execution_info(content)
-        
-        # Then add missing sections
-        if missing_sections:
-            content = add_missing_sections(content, missing_sections)
-        
-        # Ensure status markers
-        content = ensure_status_markers(content)
-        
-        # Ensure checkboxes
-        content = ensure_checkboxes(content)
+        content = amend_task_content(content)
         
         # Save amended file if output path provided
         if output_path:
@@ -800,59 +814,65 @@ def amend_task_list(markdown_path: str, output_path: Optional[str] = None) -> st
         raise
 
 
-app = typer.Typer()
-
-@app.command()
-def main(
-    input_file: str = typer.Argument(..., help="Path to the input markdown file"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Path to save the amended file (defaults to overwriting input)"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
-    check: bool = typer.Option(False, "--check", help="Only check for conformance without modifying")
-):
-    """Amend a task markdown file to conform to the template guide."""
-    
-    # Validate input file exists
-    if not os.path.exists(input_file):
-        typer.echo(f"Error: Input file {input_file} does not exist.")
-        raise typer.Exit(code=1)
-    
-    # Default output to input if not specified
-    output_path = output or input_file
+def _build_app():
+    """Build the CLI; typer is imported here so library callers do not pay for it."""
+    import typer
     
-    try:
-        if check:
-            # Just check for conformance
-            with open(input_file, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            missing_sections = check_required_sections(content)
-            
-            if missing_sections:
-                typer.echo(f"Task file does not conform to template. Missing sections:")
-                for section in missing_sections:
-                    typer.echo(f"  - {section}")
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        input_file: str = typer.Argument(..., help="Path to the input markdown file"),
+        output: Optional[str] = typer.Option(None, "--output", "-o", help="Path to save the amended file (defaults to overwriting input)"),
+        verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
+        check: bool = typer.Option(False, "--check", help="Only check for conformance without modifying")
+    ):
+        """Amend a task markdown file to conform to the template guide."""
+        
+        # Validate input file exists
+        if not os.path.exists(input_file):
+            typer.echo(f"Error: Input file {input_file} does not exist.")
+            raise typer.Exit(code=1)
+        
+        # Default output to input if not specified
+        output_path = output or input_file
+        
+        try:
+            if check:
+                # Just check for conformance
+                with open(input_file, 'r', encoding='utf-8') as file:
+                    content = file.read()
+                
+                missing_sections = check_required_sections(content)
+                
+                if missing_sections:
+                    typer.echo(f"Task file does not conform to template. Missing sections:")
+                    for section in missing_sections:
+                        typer.echo(f"  - {section}")
+                    raise typer.Exit(code=1)
+                else:
+                    typer.echo("Task file conforms to template.")
+                    raise typer.Exit(code=0)
+            else:
+                # Amend the task list
+                amended_content = amend_task_list(input_file, output_path)
+                
+                typer.echo(f"Task list amended successfully and saved to {output_path}")
+                typer.echo("You can now convert it to JSON with:")
+                typer.echo(f"  python task_to_json.py {output_path}")
+        
+        except Exception as e:
+            if not isinstance(e, typer.Exit):
+                typer.echo(f"Error: {e}", err=True)
+                if verbose:
+                    import traceback
+                    traceback.print_exc()
                 raise typer.Exit(code=1)
             else:
-                typer.echo("Task file conforms to template.")
-                raise typer.Exit(code=0)
-        else:
-            # Amend the task list
-            amended_content = amend_task_list(input_file, output_path)
-            
-            typer.echo(f"Task list amended successfully and saved to {output_path}")
-            typer.echo("You can now convert it to JSON with:")
-            typer.echo(f"  python task_to_json.py {output_path}")
+                raise e
     
-    except Exception as e:
-        if not isinstance(e, typer.Exit):
-            typer.echo(f"Error: {e}", err=True)
-            if verbose:
-                import traceback
-                traceback.print_exc()
-            raise typer.Exit(code=1)
-        else:
-            raise e
+    return app
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    _build_app()()
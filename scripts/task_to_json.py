@@ -7,16 +7,31 @@ and then converts it to JSON format for execution by the MCP.
 
 Usage:
   python task_to_json.py input.md -o output.json
+
+Optional dependency:
+  google-re2 (pip install "claude-code-mcp[fast-regex]") is used for the
+  parsing patterns when installed, which guarantees linear-time matching on
+  user-supplied markdown. Without it the standard library re module is used.
+  orjson (installed with the claude-code-mcp package) is used to serialize
+  the output when available; otherwise the json module is used.
 """
 
-import os
 import sys
 import json
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-import typer
+try:
+    import re2 as _linear_re
+except ImportError:
+    _linear_re = re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the project root to the path
 project_root = Path(__file__).resolve().parent
@@ -24,12 +39,137 @@ sys.path.insert(0, str(project_root))
 
 # Import functions from amend_task.py which has all the necessary functions
 try:
-    from amend_task import amend_task_list, check_required_sections
+    from amend_task import REQUIRED_SECTIONS, amend_task_content, check_required_sections
 except ImportError:
     print("Error: Could not import task_amender functions. Make sure amend_task.py is in the same directory.")
     sys.exit(1)
 
 
+# Patterns used by extract_task_info, compiled once at import time. They go
+# through re2 when available; flags are written inline so the same source
+# compiles under both engines.
+_HEADER_RE = _linear_re.compile(r"# Task (\d+): ([^\n]*)")
+_REQUIREMENT_NUMBER_RE = _linear_re.compile(r"\d+\.\s*")
+_FIELD_RE = _linear_re.compile(r"(?m)^\*\*([^*\n]+)\*\*:[ \t]*([^\n]*)")
+_STEP_RE = _linear_re.compile(r"- \[ \] (\d+\.\d+) ")
+
+
+# Required headers are recorded while scanning; bold labels are plain substring checks
+_REQUIRED_HEADERS = tuple(section for section in REQUIRED_SECTIONS if section.startswith("#"))
+
+
+# Above this many characters, lines are generated on demand rather than
+# materialised with splitlines(), so the document is not held twice
+_LAZY_LINES_THRESHOLD = 1 << 20
+
+
+@dataclass(slots=True)
+class Subtask:
+    """
+    A '### Task N' subtask; slots keep each one smaller than an equivalent dict.
+    
+    Subtasks are only held in this form while a document is being parsed;
+    extract_and_validate returns them as plain dicts.
+    """
+    id: str
+    title: str
+    description: str
+    execution_mode: str
+    steps: List[str]
+    dependencies: List[str]
+    status: str = "not_started"
+    
+    def to_dict(self) -> Dict:
+        """Return the subtask in its JSON output shape."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "executionMode": self.execution_mode,
+            "steps": self.steps,
+            "status": self.status,
+            "dependencies": self.dependencies
+        }
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _iter_quoted(text: str):
+    """Yield the non-empty double-quoted substrings of text, left to right."""
+    start = 0
+    while True:
+        open_quote = text.find('"', start)
+        if open_quote < 0:
+            return
+        close_quote = text.find('"', open_quote + 1)
+        if close_quote < 0:
+            return
+        if close_quote == open_quote + 1:
+            # Empty quotes; the closing quote may open the next value
+            start = close_quote
+            continue
+        yield text[open_quote + 1:close_quote]
+        start = close_quote + 1
+
+
+def _iter_lines(text: str):
+    """Yield the lines of text one at a time without building a list of them."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end < 0:
+            end = length
+        yield text[start:end].rstrip("\r")
+        start = end + 1
+
+
+def _parse_steps(steps_text: str) -> List[str]:
+    """
+    Collect '- [ ] N.M text' steps, each with its indented continuation lines.
+    
+    A step ends at an empty line or at the next '- [ ]' line.
+    """
+    steps = []
+    step_id = ""
+    current: Optional[List[str]] = None
+    # The trailing empty line flushes the last step
+    for line in steps_text.splitlines() + [""]:
+        if not line or line.startswith("- [ ]"):
+            if current is not None:
+                step_desc = "\n".join(current).strip()
+                steps.append(f"{step_id} {step_desc}")
+                current = None
+            step_match = _STEP_RE.match(line)
+            if step_match:
+                step_id = step_match.group(1)
+                current = [line[step_match.end():]]
+        elif current is not None:
+            current.append(line)
+    return steps
+
+
+def _parse_subtask_heading(line: str) -> Optional[Tuple[str, str]]:
+    """Parse a '### Task N: Title' line into (N, Title), or None if it is not one."""
+    number, separator, title = line[len("### Task "):].partition(": ")
+    if not separator or not number.isdigit():
+        return None
+    return number, title.split(" ⏳", 1)[0].strip()
+
+
+def _required_header_on_line(line: str) -> Optional[str]:
+    """Return the required header that a '#' line opens, if any."""
+    for header in _REQUIRED_HEADERS:
+        if line.startswith(header) and line[len(header):len(header) + 1] in ("", ":", " ", "\t"):
+            return header
+    return None
+
+
 def extract_task_info(content: str):
     """
     Extract key information from a markdown task file.
@@ -40,62 +180,145 @@ def extract_task_info(content: str):
     Returns:
         Dictionary containing task information
     """
+    return extract_and_validate(content, validate=False)[0]
+
+
+def extract_and_validate(content: str, validate: bool = True) -> Tuple[Dict, List[str]]:
+    """
+    Extract task information and check required sections in one pass.
+    
+    Args:
+        content: Content of the markdown file
+        validate: Whether to check required sections; when False the
+            returned list is always empty
+        
+    Returns:
+        Tuple of (task information, list of missing required sections)
+    """
     # Extract task ID and title
-    header_match = re.search(r"# Task (\d+): (.*?)( ⏳.*)?$", content, re.MULTILINE)
+    header_match = _HEADER_RE.search(content)
     if not header_match:
         raise ValueError("Could not find task ID and title in the first line")
     
     task_id = header_match.group(1)
-    title = header_match.group(2).strip()
+    title = header_match.group(2).split(" ⏳", 1)[0].strip()
     status = "not_started"  # Default status
     
+    # Walk the document line by line, routing each line into the section it
+    # belongs to. Headers and labels are recognised with startswith, so the
+    # whole document is swept once with no regex backtracking.
+    objective_lines: Optional[List[str]] = None
+    requirement_lines: Optional[List[str]] = None
+    overview_lines: Optional[List[str]] = None
+    subtask_sections: List[Tuple[str, str, List[str]]] = []
+    section: Optional[List[str]] = None
+    section_name = ""
+    section_has_text = False
+    previous_blank = False
+    seen_headers = set()
+    
+    lines = content.splitlines() if len(content) < _LAZY_LINES_THRESHOLD else _iter_lines(content)
+    for line in lines:
+        blank = not line.strip()
+        
+        if validate and line.startswith("#"):
+            header = _required_header_on_line(line)
+            if header:
+                seen_headers.add(header)
+        
+        if line.startswith("### Task"):
+            heading = _parse_subtask_heading(line) if line.startswith("### Task ") else None
+            if heading:
+                section = []
+                section_name = "subtask"
+                subtask_sections.append((heading[0], heading[1], section))
+            else:
+                section = None
+        elif line.startswith("## "):
+            if overview_lines is None and line.startswith("## Overview"):
+                section = overview_lines = [line[len("## Overview"):]]
+                section_name = "overview"
+                section_has_text = bool(section[0].strip())
+            else:
+                section = None
+        elif section_name == "subtask" and section is not None:
+            section.append(line)
+        elif objective_lines is None and line.startswith("**Objective**:"):
+            section = objective_lines = [line[len("**Objective**:"):]]
+            section_name = "objective"
+            section_has_text = bool(section[0].strip())
+        elif requirement_lines is None and line.startswith("**Requirements**:"):
+            section = requirement_lines = [line[len("**Requirements**:"):]]
+            section_name = "requirements"
+            section_has_text = bool(section[0].strip())
+        elif section is not None:
+            if blank and not section_has_text:
+                # Blank lines directly after a label are not a terminator
+                pass
+            elif section_name == "objective" and (blank or line.startswith("**Requirements**")):
+                section = None
+            elif section_name == "requirements" and (blank or line.startswith("#")):
+                section = None
+            elif section_name == "overview" and previous_blank and line.startswith("**IMPORTANT**"):
+                section = None
+            else:
+                section.append(line)
+                section_has_text = section_has_text or not blank
+        
+        previous_blank = blank
+    
     # Extract objective (optional)
-    objective = ""
-    objective_match = re.search(r"\*\*Objective\*\*:\s*(.*?)(?=\n\n|\*\*Requirements\*\*)", content, re.DOTALL)
-    if objective_match:
-        objective = objective_match.group(1).strip()
+    objective = "\n".join(objective_lines).strip() if objective_lines else ""
     
-    # Extract requirements (optional)
+    # Extract requirements (optional): numbered lines start a new item and
+    # any other lines continue the current one
     requirements = []
-    requirements_section = re.search(r"\*\*Requirements\*\*:\s*(.*?)(?=\n\n|\#\# )", content, re.DOTALL)
-    if requirements_section:
-        requirements_text = requirements_section.group(1)
-        requirement_matches = re.findall(r"\d+\.\s*(.*?)(?=\n\d+\.|\n\n|\Z)", requirements_text, re.DOTALL)
-        requirements = [req.strip() for req in requirement_matches]
+    current_requirement: Optional[List[str]] = None
+    for line in requirement_lines or []:
+        stripped = line.strip()
+        number_match = _REQUIREMENT_NUMBER_RE.match(stripped)
+        if number_match:
+            current_requirement = [stripped[number_match.end():]]
+            requirements.append(current_requirement)
+        elif current_requirement is not None:
+            current_requirement.append(line)
+    requirements = ["\n".join(item).strip() for item in requirements]
     
     # Extract overview (optional)
-    overview = ""
-    overview_match = re.search(r"## Overview\s*(.*?)(?=\n\n\*\*IMPORTANT\*\*|\n\n## )", content, re.DOTALL)
-    if overview_match:
-        overview = overview_match.group(1).strip()
+    overview = "\n".join(overview_lines).strip() if overview_lines else ""
     
     # Extract subtasks
     subtasks = []
-    subtask_pattern = r"### Task (\d+): (.*?)( ⏳.*?)?\s*\n(.*?)(?=\n### Task|\n## |$)"
-    subtask_matches = re.finditer(subtask_pattern, content, re.DOTALL)
     
-    for match in subtask_matches:
+    for subtask_id, subtask_title, body_lines in subtask_sections:
         try:
-            subtask_id = match.group(1).strip()
-            subtask_title = match.group(2).strip()
-            subtask_content = match.group(4) if len(match.groups()) > 3 else ""
+            subtask_content = "\n".join(body_lines).strip("\n")
+            
+            # Tokenize all **Label**: fields in one pass; single-line values
+            # stop at any inline bold marker, multi-line values run up to the
+            # start of the next field
+            field_matches = list(_FIELD_RE.finditer(subtask_content))
+            fields: Dict[str, str] = {}
+            field_spans: Dict[str, Tuple[int, int]] = {}
+            for i, field_match in enumerate(field_matches):
+                label = field_match.group(1)
+                if label in fields:
+                    continue
+                fields[label] = field_match.group(2).split("**", 1)[0].strip()
+                field_end = field_matches[i + 1].start() if i + 1 < len(field_matches) else len(subtask_content)
+                field_spans[label] = (field_match.start(2), field_end)
             
             # Extract execution mode
             execution_mode = "sequential"  # Default
-            mode_match = re.search(r"\*\*Execution Mode\*\*:\s*(.*?)(?=\n|\*\*)", subtask_content)
-            if mode_match:
-                mode = mode_match.group(1).strip()
-                if "parallel" in mode.lower():
-                    execution_mode = "parallel"
+            if "parallel" in fields.get("Execution Mode", "").lower():
+                execution_mode = "parallel"
             
             # Extract dependencies
             dependencies = []
-            deps_match = re.search(r"\*\*Dependencies\*\*:\s*(.*?)(?=\n|\*\*)", subtask_content)
-            if deps_match:
-                deps_text = deps_match.group(1).strip()
+            if "Dependencies" in fields:
+                deps_text = fields["Dependencies"]
                 # Extract task IDs
-                for dep in re.findall(r'"([^"]+)"', deps_text):
-                    dependencies.append(dep)
+                dependencies = list(_iter_quoted(deps_text))
                 
                 if not dependencies:
                     # Try comma-separated format
@@ -105,35 +328,24 @@ def extract_task_info(content: str):
                             dependencies.append(dep)
             
             # Extract description (first paragraph)
-            description = ""
-            desc_match = re.search(r"\*\*Description\*\*:\s*(.*?)(?=\n\n|\*\*)", subtask_content)
-            if desc_match:
-                description = desc_match.group(1).strip()
+            description = fields.get("Description", "")
             
             # Extract steps
             steps = []
-            steps_match = re.search(r"\*\*Implementation Steps\*\*:\s*(.*?)(?=\n\n\*\*|$)", subtask_content, re.DOTALL)
-            if steps_match:
-                steps_text = steps_match.group(1)
-                step_pattern = r"- \[ \] (\d+\.\d+) (.*?)(?=\n- \[ \]|\n\n|$)"
-                step_matches = re.finditer(step_pattern, steps_text, re.DOTALL)
-                
-                for step_match in step_matches:
-                    step_id = step_match.group(1)
-                    step_desc = step_match.group(2).strip()
-                    steps.append(f"{step_id} {step_desc}")
+            if "Implementation Steps" in field_spans:
+                steps_start, steps_end = field_spans["Implementation Steps"]
+                steps = _parse_steps(subtask_content[steps_start:steps_end])
             
-            subtasks.append({
-                "id": f"task-{subtask_id}",
-                "title": subtask_title,
-                "description": description,
-                "executionMode": execution_mode,
-                "steps": steps,
-                "status": "not_started",
-                "dependencies": dependencies
-            })
+            subtasks.append(Subtask(
+                id=f"task-{subtask_id}",
+                title=subtask_title,
+                description=description,
+                execution_mode=execution_mode,
+                steps=steps,
+                dependencies=dependencies
+            ))
         except Exception as e:
-            print(f"Warning: Error processing subtask {match.group(0)[:50]}...: {e}")
+            print(f"Warning: Error processing subtask {subtask_id}: {subtask_title[:50]}...: {e}")
     
     # Create result dictionary
     result = {
@@ -146,12 +358,17 @@ def extract_task_info(content: str):
         "objective": objective,
         "requirements": requirements,
         "overview": overview,
-        "subtasks": subtasks,
+        "subtasks": [subtask.to_dict() for subtask in subtasks],
         "resources": {},
         "usage_examples": []
     }
     
-    return result
+    missing_sections = [
+        section for section in REQUIRED_SECTIONS
+        if section not in seen_headers and (section in _REQUIRED_HEADERS or section not in content)
+    ] if validate else []
+    
+    return result, missing_sections
 
 
 def task_to_json(markdown_path, output_path=None, amend=True):
@@ -166,79 +383,84 @@ def task_to_json(markdown_path, output_path=None, amend=True):
     Returns:
         The JSON representation of the task
     """
-    # Check if the file exists
-    if not os.path.exists(markdown_path):
-        raise FileNotFoundError(f"Input file {markdown_path} does not exist")
-    
-    # Step 1: Check if the file needs amendment
-    with open(markdown_path, 'r', encoding='utf-8') as file:
+    # Step 1: Extract task information and check sections in the same pass.
+    # Opening directly avoids a separate exists() check and its race.
+    try:
+        file = open(markdown_path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file {markdown_path} does not exist") from None
+    with file:
         content = file.read()
     
-    missing_sections = check_required_sections(content)
-    needs_amendment = bool(missing_sections)
+    try:
+        # Section checks only matter when amendment is allowed
+        task_info, missing_sections = extract_and_validate(content, validate=amend)
+    except Exception:
+        # Unparseable before amendment; amending may still fix it
+        task_info = None
+        missing_sections = check_required_sections(content) if amend else []
     
-    # Step 2: Amend if needed
-    if needs_amendment and amend:
+    # Step 2: Amend if needed, then re-extract from the amended content
+    if missing_sections and amend:
         print(f"Task file does not conform to template. Missing sections: {', '.join(missing_sections)}")
         print("Amending task file...")
         
-        # Create a temporary file for the amended version
-        temp_path = f"{markdown_path}.amended"
-        amended_content = amend_task_list(markdown_path, temp_path)
-        
-        # Read the amended content
-        with open(temp_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        # Amend in memory; no temporary file round-trip is needed
+        content = amend_task_content(content)
+        task_info = None
     
-    # Step 3: Extract task information
-    try:
-        task_info = extract_task_info(content)
-    except Exception as e:
-        print(f"Error extracting task information: {e}")
-        if needs_amendment and amend:
-            os.unlink(temp_path)  # Clean up temporary file
-        raise
+    # Step 3: Extract task information if the first pass could not be used
+    if task_info is None:
+        try:
+            task_info = extract_task_info(content)
+        except Exception as e:
+            print(f"Error extracting task information: {e}")
+            raise
     
     # Step 4: Save to JSON if output path provided
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as file:
-            json.dump(task_info, file, indent=2)
+        with open(output_path, 'wb') as file:
+            file.write(_dumps(task_info))
         print(f"Task JSON written to {output_path}")
     
-    # Clean up temporary file if created
-    if needs_amendment and amend:
-        os.unlink(temp_path)
-    
     return task_info
 
 
-app = typer.Typer()
-
-@app.command()
-def main(
-    input_file: str = typer.Argument(..., help="Path to the input markdown file"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Path to save the JSON output (default: print to stdout)"),
-    no_amend: bool = typer.Option(False, "--no-amend", help="Do not amend the task file to conform to the template"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output")
-):
-    """Convert a task markdown file to JSON, amending it if needed."""
+def _build_app():
+    """Build the CLI; typer is imported here so library callers do not pay for it."""
+    import typer
     
-    try:
-        task_info = task_to_json(input_file, output, not no_amend)
+    app = typer.Typer()
+    
+    @app.command()
+    def main(
+        input_file: str = typer.Argument(..., help="Path to the input markdown file"),
+        output: Optional[str] = typer.Option(None, "--output", "-o", help="Path to save the JSON output (default: print to stdout)"),
+        no_amend: bool = typer.Option(False, "--no-amend", help="Do not amend the task file to conform to the template"),
+        verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output")
+    ):
+        """Convert a task markdown file to JSON, amending it if needed."""
         
-        if not output:
-            # Print to stdout if no output file specified
-            typer.echo(json.dumps(task_info, indent=2))
+        try:
+            task_info = task_to_json(input_file, output, not no_amend)
             
-        typer.echo("Task conversion completed successfully.")
+            if not output:
+                # Print to stdout if no output file specified
+                sys.stdout.flush()
+                sys.stdout.buffer.write(_dumps(task_info) + b"\n")
+                sys.stdout.buffer.flush()
+                
+            typer.echo("Task conversion completed successfully.")
+        
+        except Exception as e:
+            typer.echo(f"Error: {e}", err=True)
+            if verbose:
+                import traceback
+                traceback.print_exc()
+            raise typer.Exit(code=1)
     
-    except Exception as e:
-        typer.echo(f"Error: {e}", err=True)
-        if verbose:
-            import traceback
-            traceback.print_exc()
-        raise typer.Exit(code=1)
+    return app
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    _build_app()()
@@ -0,0 +1,187 @@
+"""
+On-disk response cache for Claude CLI prompts.
+
+Responses are stored content-addressed under ~/.cache/claude_code_mcp, one JSON
+file per SHA-256 hash of the prompt. Re-running the same task list therefore
+reads earlier responses from disk instead of invoking Claude again.
+
+The cache is opt-in: it is only consulted when CLAUDE_MCP_CACHE_ENABLED=1 and it
+has not been switched off for the current process with disable() (the
+execute_task --no-cache flag). Entries expire after CLAUDE_MCP_CACHE_TTL_DAYS
+days (default 7). CLAUDE_MCP_CACHE_DIR overrides the cache location.
+
+Documentation:
+- hashlib: https://docs.python.org/3/library/hashlib.html
+
+Sample Input:
+  from claude_code_mcp import llm_cache
+  llm_cache.put("Say hello", "Hello!")
+  llm_cache.get("Say hello")
+
+Expected Output:
+  "Hello!"
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+# Switched off by disable(), e.g. for execute_task --no-cache
+_disabled = False
+
+
+def is_enabled() -> bool:
+    """Return True if the cache is turned on for this process."""
+    return not _disabled and os.environ.get("CLAUDE_MCP_CACHE_ENABLED") == "1"
+
+
+def disable() -> None:
+    """Turn the cache off for the rest of this process."""
+    global _disabled
+    _disabled = True
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding cache entries."""
+    return Path(os.environ.get("CLAUDE_MCP_CACHE_DIR", "~/.cache/claude_code_mcp")).expanduser()
+
+
+def _ttl_seconds() -> float:
+    """Return the entry lifetime in seconds."""
+    return float(os.environ.get("CLAUDE_MCP_CACHE_TTL_DAYS", "7")) * 86400
+
+
+def _entry_path(prompt: str, system_prompt: Optional[str] = None) -> Path:
+    """Return the cache file for a prompt and optional system prompt."""
+    if system_prompt is not None:
+        prompt = f"{system_prompt}\0{prompt}"
+    key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return _cache_dir() / f"{key}.json"
+
+
+def get(prompt: str, system_prompt: Optional[str] = None) -> Optional[str]:
+    """
+    Look up a cached response.
+
+    Args:
+        prompt: The prompt that was sent to Claude
+        system_prompt: The system prompt it was sent with, if any
+
+    Returns:
+        The cached response, or None if caching is off or the entry is missing or expired
+    """
+    if not is_enabled():
+        return None
+
+    try:
+        with open(_entry_path(prompt, system_prompt), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Anything but a well-formed entry is treated as a miss
+    if not isinstance(entry, dict) or not isinstance(entry.get("response"), str):
+        return None
+    try:
+        expired = time.time() - entry.get("ts", 0) > entry.get("ttl", _ttl_seconds())
+    except TypeError:
+        return None
+    if expired:
+        return None
+
+    logger.debug("Using cached Claude response")
+    return entry["response"]
+
+
+def put(prompt: str, response: str, system_prompt: Optional[str] = None) -> None:
+    """
+    Store a response for a prompt.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent readers never see a partial entry. The temporary file is
+    removed if the write fails.
+
+    Args:
+        prompt: The prompt that was sent to Claude
+        response: Claude's response
+        system_prompt: The system prompt it was sent with, if any
+    """
+    if not is_enabled():
+        return
+
+    path = _entry_path(prompt, system_prompt)
+    entry = {"response": response, "ts": time.time(), "ttl": _ttl_seconds()}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError as e:
+        logger.warning(f"Could not write Claude response cache entry: {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(temp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        logger.warning(f"Could not write Claude response cache entry: {e}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Track validation failures
+    all_validation_failures = []
+    total_tests = 0
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["CLAUDE_MCP_CACHE_DIR"] = cache_dir
+        os.environ["CLAUDE_MCP_CACHE_ENABLED"] = "1"
+
+        # Test 1: Round trip
+        total_tests += 1
+        try:
+            put("Say hello", "Hello!")
+            assert get("Say hello") == "Hello!", "Expected cached response"
+            assert get("Say goodbye") is None, "Expected miss for unknown prompt"
+        except Exception as e:
+            all_validation_failures.append(f"Round trip test failed: {str(e)}")
+
+        # Test 2: Expired entries are ignored
+        total_tests += 1
+        try:
+            os.environ["CLAUDE_MCP_CACHE_TTL_DAYS"] = "0"
+            put("Expire me", "Old")
+            time.sleep(0.01)
+            assert get("Expire me") is None, "Expected expired entry to miss"
+            del os.environ["CLAUDE_MCP_CACHE_TTL_DAYS"]
+        except Exception as e:
+            all_validation_failures.append(f"Expiry test failed: {str(e)}")
+
+        # Test 3: disable() turns lookups off
+        total_tests += 1
+        try:
+            disable()
+            assert get("Say hello") is None, "Expected no lookup after disable()"
+        except Exception as e:
+            all_validation_failures.append(f"Disable test failed: {str(e)}")
+
+    # Final validation result
+    if all_validation_failures:
+        failed = len(all_validation_failures)
+        print(f"❌ VALIDATION FAILED - {failed} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
+        print("Function is validated and formal tests can now be written")
+        sys.exit(0)
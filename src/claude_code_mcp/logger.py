@@ -30,13 +30,17 @@ logger.add(
     level="INFO",
 )
 
-# Add a file handler for more permanent logging
+# Add a file handler for more permanent logging; writes are queued to a
+# background thread so callers never wait on disk I/O
 logger.add(
     "logs/claude_code_mcp.log",
     rotation="10 MB",
     retention="1 week",
     compression="zip",
     level="DEBUG",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
 )
 
 
@@ -63,6 +67,9 @@ def configure(config: Dict[str, Any]) -> None:
             retention=config.get("log_retention", "1 week"),
             compression=config.get("log_compression", "zip"),
             level=config.get("file_log_level", level),
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
 
@@ -20,17 +20,61 @@ Expected Output:
   JSON response with task data or execution results
 """
 
-import json
+import hashlib
+import os
 import sys
 import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Literal, Mapping, Optional, Tuple, Union
 
+import orjson
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from claude_code_mcp.task_converter import convert_task
-from claude_code_mcp.task_executor import TaskExecutor, ExecutionMode
+from claude_code_mcp.task_executor import TaskExecutor, ExecutionMode, TaskStatus
+
+# Worker threads for blocking calls made from the shared loop (status file I/O)
+MAX_BLOCKING_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# One long-lived event loop, on a daemon thread, runs every coroutine the
+# handlers submit; it is started on first use
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting its thread if needed."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=MAX_BLOCKING_WORKERS, thread_name_prefix="mcp-blocking")
+            )
+            threading.Thread(target=_loop.run_forever, name="mcp-task-loop", daemon=True).start()
+        return _loop
+
+
+# Executions scheduled on the shared loop that have not finished yet, by task id
+_task_futures: Dict[str, Future] = {}
+
+# Shared executor, so tasks started by execute_task stay visible to task_status
+_executor: Optional[TaskExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> TaskExecutor:
+    """Return the shared TaskExecutor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = TaskExecutor()
+        return _executor
 
 
 class TaskConversionRequest(BaseModel):
@@ -45,6 +89,31 @@ class TaskConversionResponse(BaseModel):
     outputPath: Optional[str] = Field(None, description="Path where the JSON was saved, if requested.")
 
 
+# Accepted spellings of request parameters, camelCase first; the snake_case
+# forms may come from the JS side
+_MARKDOWN_ALIASES = ("markdownPath", "markdown_path")
+_OUTPUT_ALIASES = ("outputPath", "output_path")
+
+
+def _first(request: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Return the first non-empty value among the given request keys, or None."""
+    for key in keys:
+        value = request.get(key)
+        if value:
+            return value
+    return None
+
+
+def _missing_parameter(context: str, name: str) -> Dict[str, Any]:
+    """Build the error response for a missing required parameter without raising."""
+    message = f"{name} parameter is required"
+    logger.error("{}: {}", context, message)
+    return {
+        "error": message,
+        "status": "error"
+    }
+
+
 def handle_convert_task_markdown(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     Handle a task conversion request from the MCP server.
@@ -57,19 +126,16 @@ def handle_convert_task_markdown(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Log the request for debugging
-        logger.debug(f"Received convert_task_markdown request: {request}")
+        logger.opt(lazy=True).debug("Received convert_task_markdown request: {!r}", lambda: request)
         
         # Extract parameters - be flexible as MCP requests might have different formats
-        markdown_path = request.get("markdownPath", None)
-        output_path = request.get("outputPath", None)
+        markdown_path = _first(request, _MARKDOWN_ALIASES)
+        output_path = _first(request, _OUTPUT_ALIASES)
         
         if not markdown_path:
-            # Try different parameter formats that might come from JS side
-            markdown_path = request.get("markdown_path", None)
-            if not markdown_path:
-                raise ValueError("markdownPath parameter is required")
+            return _missing_parameter("Error converting task", "markdownPath")
         
-        # Convert the task
+        # Convert the task; convert_task reuses its last conversion of an unchanged file
         task_data = convert_task(markdown_path, output_path)
         
         # Return a simplified response to make integration easier
@@ -95,17 +161,21 @@ class HealthCheckResponse(BaseModel):
     endpoints: List[str] = ["health", "convert_task_markdown", "claude_code", "execute_task", "task_status"]
 
 
-def handle_health_check() -> Dict[str, Any]:
+# The health payload never changes, so it is built once at import
+_HEALTH_RESPONSE = HealthCheckResponse().model_dump()
+
+
+def handle_health_check(request: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Handle a health check request from the MCP server.
     
+    Args:
+        request: Ignored; accepted so the endpoint can be called like the others
+    
     Returns:
         Dictionary containing the health check response data
     """
-    response = HealthCheckResponse(
-        endpoints=["health", "convert_task_markdown", "claude_code", "execute_task", "task_status"]
-    )
-    return response.dict()
+    return {**_HEALTH_RESPONSE, "endpoints": list(_HEALTH_RESPONSE["endpoints"])}
 
 
 class ClaudeCodeRequest(BaseModel):
@@ -128,15 +198,40 @@ class TaskExecutionRequest(BaseModel):
     """Request model for task execution MCP endpoint."""
     id: Optional[str] = Field(None, description="Optional ID for the task. If not provided, one will be generated.")
     subtasks: List[Dict[str, Any]] = Field(..., description="List of subtasks to execute.")
-    executionMode: Optional[str] = Field(ExecutionMode.SEQUENTIAL, description="Execution mode: 'sequential' or 'parallel'.")
+    executionMode: Optional[Literal["sequential", "parallel"]] = Field("sequential", description="Execution mode: 'sequential' or 'parallel'.")
 
 
-def handle_claude_code(request: Dict[str, Any]) -> Dict[str, Any]:
+# Request validators, built once at import instead of on every call
+_CLAUDE_REQ_ADAPTER = TypeAdapter(ClaudeCodeRequest)
+_TASK_EXEC_ADAPTER = TypeAdapter(TaskExecutionRequest)
+
+
+def _claude_code_response(validated_request: ClaudeCodeRequest) -> Dict[str, Any]:
     """
-    Handle a claude_code request from the MCP server.
+    Build the claude_code response for a validated request.
     
     This is a placeholder for the actual implementation, which would forward
     the request to Claude Code CLI or execute the task directly.
+    """
+    # TODO: Implement actual Claude Code integration
+    # For now, this is just a mock response
+    
+    # Read the validated fields straight from the instance dict
+    fields = validated_request.__dict__
+    task_description = fields["taskDescription"]
+    
+    logger.info("Received Claude Code request: {}", task_description)
+    
+    return {
+        "result": f"Executed: {task_description or fields['prompt'][:30]}...",
+        "taskId": "mock-task-id-123",
+        "parentTaskId": fields["parentTaskId"]
+    }
+
+
+def handle_claude_code(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Handle a claude_code request from the MCP server.
     
     Args:
         request: Dictionary containing the request parameters
@@ -146,18 +241,7 @@ def handle_claude_code(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Validate request with Pydantic model
-        validated_request = ClaudeCodeRequest(**request)
-        
-        # TODO: Implement actual Claude Code integration
-        # For now, this is just a mock response
-        
-        logger.info(f"Received Claude Code request: {validated_request.taskDescription}")
-        
-        return {
-            "result": f"Executed: {validated_request.taskDescription or validated_request.prompt[:30]}...",
-            "taskId": "mock-task-id-123",
-            "parentTaskId": validated_request.parentTaskId
-        }
+        return _claude_code_response(_CLAUDE_REQ_ADAPTER.validate_python(request))
     except Exception as e:
         logger.error(f"Error executing Claude Code task: {e}")
         return {
@@ -166,6 +250,48 @@ def handle_claude_code(request: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+# Started messages for the known execution modes, built once
+_STARTED_MESSAGES = {
+    mode: f"Task execution started in {mode.value} mode" for mode in ExecutionMode
+}
+
+
+def _forget_task_future(task_id: str, future: Future) -> None:
+    """Drop a finished execution from _task_futures unless the id was rescheduled."""
+    if _task_futures.get(task_id) is future:
+        del _task_futures[task_id]
+
+
+def _start_task_execution(validated_request: TaskExecutionRequest) -> Dict[str, Any]:
+    """Schedule a validated task on the shared loop and return the started response."""
+    # Get the shared task executor
+    executor = _get_executor()
+    
+    # Derive a stable id from the subtasks when none is given
+    task_id = validated_request.id or "task-" + hashlib.blake2b(
+        orjson.dumps(validated_request.subtasks, option=orjson.OPT_NON_STR_KEYS), digest_size=8
+    ).hexdigest()
+    
+    # Convert to dict for executor
+    task_data = {
+        "id": task_id,
+        "subtasks": validated_request.subtasks,
+        "executionMode": validated_request.executionMode
+    }
+    
+    # Schedule execution on the shared loop without waiting for it
+    future = asyncio.run_coroutine_threadsafe(executor.execute_task(task_data), _get_loop())
+    _task_futures[task_id] = future
+    future.add_done_callback(functools.partial(_forget_task_future, task_id))
+    
+    return {
+        "success": True,
+        "message": _STARTED_MESSAGES.get(validated_request.executionMode)
+        or f"Task execution started in {validated_request.executionMode} mode",
+        "taskId": task_id
+    }
+
+
 def handle_task_execution(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     Handle a task execution request from the MCP server.
@@ -178,43 +304,10 @@ def handle_task_execution(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Log the request for debugging
-        logger.debug(f"Received task_execution request: {request}")
+        logger.opt(lazy=True).debug("Received task_execution request: {!r}", lambda: request)
         
         # Validate request with Pydantic model
-        validated_request = TaskExecutionRequest(**request)
-        
-        # Create task executor
-        executor = TaskExecutor()
-        
-        # Start task execution
-        task_id = validated_request.id or f"task-{hash(str(validated_request.subtasks))}" 
-        
-        # Convert to dict for executor
-        task_data = {
-            "id": task_id,
-            "subtasks": validated_request.subtasks,
-            "executionMode": validated_request.executionMode
-        }
-        
-        # Execute the task (use a wrapper to run the async function)
-        def run_async(task_data):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(executor.execute_task(task_data))
-            finally:
-                loop.close()
-        
-        # Start execution in a separate thread to avoid blocking
-        import threading
-        thread = threading.Thread(target=lambda: run_async(task_data))
-        thread.start()
-        
-        return {
-            "success": True,
-            "message": f"Task execution started in {validated_request.executionMode} mode",
-            "taskId": task_id
-        }
+        return _start_task_execution(_TASK_EXEC_ADAPTER.validate_python(request))
     except Exception as e:
         logger.error(f"Error executing task: {e}")
         return {
@@ -235,27 +328,22 @@ def handle_task_status(request: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         # Log the request for debugging
-        logger.debug(f"Received task_status request: {request}")
+        logger.opt(lazy=True).debug("Received task_status request: {!r}", lambda: request)
         
         # Extract task ID
         task_id = request.get("taskId")
         if not task_id:
-            raise ValueError("taskId parameter is required")
-        
-        # Create task executor
-        executor = TaskExecutor()
+            return _missing_parameter("Error getting task status", "taskId")
         
-        # Get task status (use a wrapper to run the async function)
-        def run_async(task_id):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(executor.get_task_status(task_id))
-            finally:
-                loop.close()
+        # Get the shared task executor
+        executor = _get_executor()
         
-        # Get status
-        status = run_async(task_id)
+        # Answered on this thread from the executor's registry or the saved
+        # status file; the shared loop is never involved
+        status = executor.get_task_status_nowait(task_id)
+        if status is None and task_id in _task_futures:
+            # Scheduled, but the loop has not started running it yet
+            status = {"taskId": task_id, "status": TaskStatus.PENDING.value}
         
         if status is None:
             return {
@@ -275,20 +363,24 @@ def handle_task_status(request: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def register_mcp_endpoints() -> Dict[str, Any]:
+# Endpoint table, built once; consumers get a read-only view of it
+_ENDPOINTS: Mapping[str, Callable[..., Dict[str, Any]]] = MappingProxyType({
+    "health": handle_health_check,
+    "convert_task_markdown": handle_convert_task_markdown,
+    "claude_code": handle_claude_code,
+    "execute_task": handle_task_execution,
+    "task_status": handle_task_status
+})
+
+
+def register_mcp_endpoints() -> Mapping[str, Callable[..., Dict[str, Any]]]:
     """
     Register MCP endpoints for the task orchestration system.
     
     Returns:
-        Dictionary containing the endpoint configuration
+        Read-only mapping of endpoint names to handler functions
     """
-    return {
-        "health": handle_health_check,
-        "convert_task_markdown": handle_convert_task_markdown,
-        "claude_code": handle_claude_code,
-        "execute_task": handle_task_execution,
-        "task_status": handle_task_status
-    }
+    return _ENDPOINTS
 
 
 if __name__ == "__main__":
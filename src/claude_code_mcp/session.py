@@ -0,0 +1,360 @@
+"""
+Persistent Claude CLI sessions for Claude Code MCP.
+
+This module keeps long-lived `claude` processes alive so that repeated prompts
+do not pay the CLI startup and authentication cost on every call. Each session
+runs Claude in print mode with stream-json input and output: prompts are written
+to stdin as one JSON message per line, and the end of each response is framed
+by the CLI's `result` event.
+
+Sessions are pooled per process and per system prompt, so a fixed system
+prompt stays identical across calls and benefits from Claude's prompt cache. A
+session that has exited, failed or sat idle for longer than
+CLAUDE_SESSION_TIMEOUT seconds (default 120) is discarded and a fresh one is
+spawned transparently. Prompts sent to the same session share its conversation
+context, which is why the CLI only uses these sessions when CLAUDE_MCP_SESSIONS=1.
+
+Documentation:
+- Claude Code CLI: https://docs.anthropic.com/en/docs/claude-code/cli-usage
+- subprocess: https://docs.python.org/3/library/subprocess.html
+- queue: https://docs.python.org/3/library/queue.html
+
+Sample Input:
+  from claude_code_mcp.session import run_prompt
+  run_prompt("Summarize the task in one sentence.", timeout=300)
+
+Expected Output:
+  "The task converts markdown task lists into executable JSON."
+"""
+
+import atexit
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import IO, Any, Dict, List, Optional
+
+from loguru import logger
+
+# Idle time after which a pooled session is considered stale
+CLAUDE_SESSION_TIMEOUT = float(os.environ.get("CLAUDE_SESSION_TIMEOUT", "120"))
+
+# Command used to start a persistent Claude session
+CLAUDE_SESSION_COMMAND = [
+    "claude",
+    "--print",
+    "--input-format", "stream-json",
+    "--output-format", "stream-json",
+    "--verbose",
+]
+
+# Marker pushed onto a session's line queue when stdout closes
+_EOF = None
+
+# Lines of stderr kept for the error message when a session fails
+STDERR_TAIL_LINES = 50
+
+
+class ClaudeSession:
+    """A long-lived Claude CLI process that answers prompts one at a time."""
+
+    def __init__(self, command: Optional[List[str]] = None, system_prompt: Optional[str] = None):
+        """
+        Start the Claude process.
+
+        Args:
+            command: Command line to run (default: CLAUDE_SESSION_COMMAND)
+            system_prompt: System prompt for every prompt sent to this session
+        """
+        self.command = list(command or CLAUDE_SESSION_COMMAND)
+        self.system_prompt = system_prompt
+        if system_prompt is not None:
+            self.command += ["--system-prompt", system_prompt]
+        self.proc = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        # All three pipes were requested above, so Popen always creates them
+        assert self.proc.stdin and self.proc.stdout and self.proc.stderr
+        self._stdin: IO[bytes] = self.proc.stdin
+        self._stdout: IO[bytes] = self.proc.stdout
+        self._stderr: IO[bytes] = self.proc.stderr
+        self.last_used = time.monotonic()
+
+        # stdout is drained by a reader thread so send() can enforce a timeout.
+        # Lines stay raw bytes: they are only ever handed to the JSON parser,
+        # which decodes them itself
+        self._lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read_stdout, daemon=True)
+        self._reader.start()
+
+        # stderr is drained on its own thread so a chatty CLI cannot block on a
+        # full pipe; the tail is reported when the session fails
+        self._stderr_tail: "deque[str]" = deque(maxlen=STDERR_TAIL_LINES)
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
+        logger.debug(f"Started Claude session (pid {self.proc.pid})")
+
+    def _read_stdout(self) -> None:
+        """Forward stdout lines to the line queue until the process exits."""
+        for line in self._stdout:
+            self._lines.put(line)
+        self._lines.put(_EOF)
+
+    def _read_stderr(self) -> None:
+        """Keep the last STDERR_TAIL_LINES lines of stderr."""
+        for line in self._stderr:
+            self._stderr_tail.append(line.decode("utf-8", errors="replace"))
+
+    def stderr_tail(self) -> str:
+        """Return the most recent stderr output of the Claude process."""
+        return "".join(self._stderr_tail).strip()
+
+    def send(self, prompt: str, timeout: float = 300) -> str:
+        """
+        Send a prompt and wait for the complete response.
+
+        Args:
+            prompt: The prompt to send to Claude
+            timeout: Seconds to wait for the response
+
+        Returns:
+            The response text from Claude
+
+        Raises:
+            TimeoutError: If no complete response arrives within timeout
+            RuntimeError: If the process exits or reports an error
+        """
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        self._stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+        self._stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No response from Claude session within {timeout} seconds")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+
+            if line is _EOF:
+                # Let stderr finish draining so the message includes the cause
+                self._stderr_reader.join(timeout=1)
+                error = f"Claude session exited with code {self.proc.wait()}"
+                stderr = self.stderr_tail()
+                raise RuntimeError(f"{error}: {stderr}" if stderr else error)
+
+            event = self._parse_event(line)
+            if event.get("type") != "result":
+                continue
+
+            self.last_used = time.monotonic()
+            if event.get("is_error"):
+                raise RuntimeError(f"Claude reported an error: {event.get('result', '')}")
+            return str(event.get("result", "")).strip()
+
+    @staticmethod
+    def _parse_event(line: bytes) -> Dict[str, Any]:
+        """Parse one stream-json line; non-JSON lines are ignored."""
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return {}
+        return event if isinstance(event, dict) else {}
+
+    def is_alive(self) -> bool:
+        """Return True if the process is running and has not been idle too long."""
+        if self.proc.poll() is not None:
+            return False
+        return time.monotonic() - self.last_used <= CLAUDE_SESSION_TIMEOUT
+
+    def close(self) -> None:
+        """Stop the Claude process."""
+        if self.proc.poll() is None:
+            try:
+                self._stdin.close()
+                self.proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.proc.kill()
+                self.proc.wait()
+        logger.debug(f"Closed Claude session (pid {self.proc.pid})")
+
+
+# Idle sessions available for reuse, keyed by system prompt, at most one per CPU each
+_session_pools: Dict[Optional[str], "queue.Queue[ClaudeSession]"] = {}
+_session_pools_lock = threading.Lock()
+
+
+def _pool_for(system_prompt: Optional[str]) -> "queue.Queue[ClaudeSession]":
+    """Return the idle-session pool for a system prompt."""
+    with _session_pools_lock:
+        pool = _session_pools.get(system_prompt)
+        if pool is None:
+            pool = _session_pools[system_prompt] = queue.Queue(maxsize=os.cpu_count() or 4)
+        return pool
+
+
+def acquire_session(system_prompt: Optional[str] = None) -> ClaudeSession:
+    """
+    Take a live session from the pool, or start a new one.
+
+    Args:
+        system_prompt: System prompt the session must have been started with
+
+    Returns:
+        A session that is not shared with any other caller
+    """
+    pool = _pool_for(system_prompt)
+    while True:
+        try:
+            session = pool.get_nowait()
+        except queue.Empty:
+            return ClaudeSession(system_prompt=system_prompt)
+        if session.is_alive():
+            return session
+        session.close()
+
+
+def release_session(session: ClaudeSession) -> None:
+    """
+    Return a session to the pool, closing it if it is stale or the pool is full.
+
+    Args:
+        session: Session previously obtained from acquire_session
+    """
+    if not session.is_alive():
+        session.close()
+        return
+    try:
+        _pool_for(session.system_prompt).put_nowait(session)
+    except queue.Full:
+        session.close()
+
+
+def run_prompt(prompt: str, timeout: float = 300, system_prompt: Optional[str] = None) -> str:
+    """
+    Send a prompt through a pooled session.
+
+    A session that fails is closed and the prompt is retried once on a fresh
+    session before the error is raised.
+
+    Args:
+        prompt: The prompt to send to Claude
+        timeout: Seconds to wait for the response
+        system_prompt: Optional system prompt; sessions are reused per system prompt
+
+    Returns:
+        The response text from Claude
+    """
+    for attempt in range(2):
+        session = acquire_session(system_prompt)
+        try:
+            response = session.send(prompt, timeout)
+        except TimeoutError:
+            # A timed-out session may still be producing output; never reuse it
+            session.close()
+            raise
+        except Exception as e:
+            session.close()
+            if attempt:
+                raise
+            logger.warning(f"Claude session failed, retrying on a fresh session: {e}")
+            continue
+        release_session(session)
+        return response
+    raise AssertionError("unreachable: the second attempt returns or raises")
+
+
+@atexit.register
+def close_all_sessions() -> None:
+    """Close every idle session in the pools."""
+    with _session_pools_lock:
+        pools = list(_session_pools.values())
+    for pool in pools:
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _validate_session() -> bool:
+    """Run validation checks for the session module."""
+    import sys
+
+    # A stand-in CLI that answers each stream-json message with a result event
+    echo_command = [
+        sys.executable, "-c",
+        "import json, sys\n"
+        "for line in sys.stdin:\n"
+        "    text = json.loads(line)['message']['content']\n"
+        "    print(json.dumps({'type': 'system'}), flush=True)\n"
+        "    print(json.dumps({'type': 'result', 'result': text.upper()}), flush=True)\n",
+    ]
+
+    # Track validation failures
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: One session answers several prompts
+    total_tests += 1
+    try:
+        session = ClaudeSession(echo_command)
+        assert session.send("first", timeout=10) == "FIRST"
+        assert session.send("second", timeout=10) == "SECOND"
+        assert session.is_alive(), "Session should still be alive"
+        session.close()
+        assert not session.is_alive(), "Closed session should not be alive"
+    except Exception as e:
+        all_validation_failures.append(f"Session reuse test failed: {str(e)}")
+
+    # Test 2: Released sessions are reused from the pool
+    total_tests += 1
+    try:
+        session = ClaudeSession(echo_command)
+        release_session(session)
+        assert acquire_session() is session, "Expected the pooled session back"
+        session.close()
+    except Exception as e:
+        all_validation_failures.append(f"Session pool test failed: {str(e)}")
+
+    # Test 3: A session that exits reports an error, with its stderr, instead of hanging
+    total_tests += 1
+    try:
+        session = ClaudeSession([sys.executable, "-c", "import sys; sys.exit('not logged in')"])
+        try:
+            session.send("anything", timeout=10)
+            all_validation_failures.append("Exited session test failed: expected RuntimeError")
+        except RuntimeError as e:
+            assert "not logged in" in str(e), f"Expected stderr in error, got: {e}"
+        except OSError:
+            pass
+        session.close()
+    except Exception as e:
+        all_validation_failures.append(f"Exited session test failed: {str(e)}")
+
+    # Final validation result
+    if all_validation_failures:
+        failed = len(all_validation_failures)
+        print(f"❌ VALIDATION FAILED - {failed} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        return False
+    else:
+        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
+        print("Function is validated and formal tests can now be written")
+        return True
+
+
+if __name__ == "__main__":
+    # Run validation when executed directly
+    success = _validate_session()
+    import sys
+    sys.exit(0 if success else 1)
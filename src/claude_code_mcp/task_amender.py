@@ -11,6 +11,7 @@ ensuring all required sections are present and properly formatted.
 Documentation:
 - Markdown: https://www.markdownguide.org/
 - Task Format: See docs/memory_bank/guides/TASK_LIST_TEMPLATE_GUIDE.md
+  (CLAUDE_MCP_TEMPLATE_GUIDE points at a different copy of the guide)
 
 Sample Input:
   Basic task description with missing sections
@@ -23,7 +24,8 @@ import re
 import sys
 import os
 import argparse
-from pathlib import Path
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Set
 from loguru import logger
 
@@ -42,7 +44,47 @@ REQUIRED_SECTIONS = [
     "## Report Documentation Requirements"  # Report Documentation
 ]
 
-# Template sections to add if missing
+# Section names are compared against each other on every amend, so share one
+# interned object per name and let equality checks succeed on identity
+REQUIRED_SECTIONS = [sys.intern(section) for section in REQUIRED_SECTIONS]
+
+# Compiled patterns shared by the checks and amendments below
+_TITLE_RE = re.compile(r"^(#\s+Task\s+\d+:[^#\n]+)$", re.MULTILINE)
+_TITLE_LINE_RE = re.compile(r"^#\s+Task.+?$", re.MULTILINE)
+_TITLE_NUM_RE = re.compile(r"#\s*Task\s+(\d+)")
+_SUBTASK_RE = re.compile(r"^(###\s+Task\s+\d+:[^#\n]+)$", re.MULTILINE)
+_SUBTASK_HEADER_RE = re.compile(r"###\s+Task\s+\d+:")
+_TASK_NUM_RE = re.compile(r"Task\s+(\d+)")
+_TASK_NAME_RE = re.compile(r"^###\s+(Task\s+\d+:.+?)$", re.MULTILINE)
+# A task section runs line by line until the next heading of level 1-3 or the end of the document
+_TASK_SECTION_RE = re.compile(r"^(###\s+Task\s+\d+:[^\n]*(?:\n(?!#{1,3}\s)[^\n]*)*\n?)", re.MULTILINE)
+# Section headers, **Metadata**: markers, task headers and any other heading of
+# level 1-3 (which ends a task section), told apart by the matching group name
+_SECTION_SCAN_RE = re.compile(
+    r"^(?:(?P<task>###\s+Task\s+\d+:)|(?P<header>#+\s+[\w\s-]+)$|(?P<meta>\*\*[\w\s-]+\*\*):|(?P<heading>#{1,3}\s))",
+    re.MULTILINE,
+)
+_NEXT_MAIN_SECTION_RE = re.compile(r"^##\s+[^#]", re.MULTILINE)
+_STEP_RE = re.compile(r"^(\s*-\s+)([^[\]\n]+)$", re.MULTILINE)
+_DEP_RE = re.compile(r"depends\s+on:?\s+([^.\n]+)", re.IGNORECASE)
+_DEP_SPLIT_RE = re.compile(r",|\sand\s|\s+")
+_PRIORITY_LINE_RE = re.compile(r"\*\*Priority\*\*:.+?\*\*Impact\*\*:.+?$", re.MULTILINE)
+_EXECUTION_MODE_FIELD_RE = re.compile(r"(\*\*Execution Mode\*\*:.+?)(\n\n|\n\*\*)", re.DOTALL)
+_IMPACT_FIELD_RE = re.compile(r"(\*\*Impact\*\*:.+?)(\n\n|\n\*\*)", re.DOTALL)
+
+# Required header sections as one alternation, matched against heading lines.
+# Headers match fuzzily; the name of the matching group identifies the section.
+# Markers like **Objective** may appear anywhere and are plain substring checks.
+_REQUIRED_HEADER_GROUPS = {
+    f"s{i}": section for i, section in enumerate(REQUIRED_SECTIONS) if section.startswith("#")
+}
+_REQUIRED_HEADERS_RE = re.compile("|".join(
+    f"(?P<{name}>" + re.escape(section.split(":")[0]).replace("\\#", "#\\s*") + r"[:\s])"
+    for name, section in _REQUIRED_HEADER_GROUPS.items()
+))
+_REQUIRED_MARKERS = [section for section in REQUIRED_SECTIONS if not section.startswith("#")]
+
+# Template sections to add if missing; {number} is filled in with str.format
 TEMPLATE_SECTIONS = {
     "**Objective**": "**Objective**: [REPLACE WITH SPECIFIC OBJECTIVE]\n\n",
     
@@ -109,7 +151,7 @@ WebSearch: "site:github.com [REPLACE WITH SPECIFIC QUERY]"
 
 """,
     
-    "### Task": """### Task [NUMBER]: [FEATURE NAME] ⏳ Not Started
+    "### Task": """### Task {number}: [FEATURE NAME] ⏳ Not Started
 
 **Priority**: [HIGH/MEDIUM/LOW] | **Complexity**: [HIGH/MEDIUM/LOW] | **Impact**: [HIGH/MEDIUM/LOW]
 
@@ -121,7 +163,7 @@ WebSearch: "site:github.com [REPLACE WITH SPECIFIC QUERY]"
 - [ ] Research [SPECIFIC ASPECT]
 
 **Implementation Steps**:
-- [ ] [NUMBER].[NUMBER] [STEP DESCRIPTION]
+- [ ] {number}.{number} [STEP DESCRIPTION]
   - [SUB-STEP]
   - [SUB-STEP]
   - [SUB-STEP]
@@ -143,54 +185,54 @@ WebSearch: "site:github.com [REPLACE WITH SPECIFIC QUERY]"
 
 """,
     
-    "### Task Verification": """### Task [NUMBER]: Completion Verification and Iteration ⏳ Not Started
+    "### Task Verification": """### Task {number}: Completion Verification and Iteration ⏳ Not Started
 
 **Priority**: CRITICAL | **Complexity**: LOW | **Impact**: CRITICAL
 
 **Implementation Steps**:
-- [ ] [NUMBER].1 Review all task reports
+- [ ] {number}.1 Review all task reports
   - Read all reports in `/docs/reports/[TASK]_task_*`
   - Create checklist of incomplete features
   - Identify failed tests or missing functionality
   - Document specific issues preventing completion
   - Prioritize fixes by impact
 
-- [ ] [NUMBER].2 Create task completion matrix
+- [ ] {number}.2 Create task completion matrix
   - Build comprehensive status table
   - Mark each sub-task as COMPLETE/INCOMPLETE
   - List specific failures for incomplete tasks
   - Identify blocking dependencies
   - Calculate overall completion percentage
 
-- [ ] [NUMBER].3 Iterate on incomplete tasks
+- [ ] {number}.3 Iterate on incomplete tasks
   - Return to first incomplete task
   - Fix identified issues
   - Re-run validation tests
   - Update verification report
   - Continue until task passes
 
-- [ ] [NUMBER].4 Re-validate completed tasks
+- [ ] {number}.4 Re-validate completed tasks
   - Ensure no regressions from fixes
   - Run integration tests
   - Verify cross-task compatibility
   - Update affected reports
   - Document any new limitations
 
-- [ ] [NUMBER].5 Final comprehensive validation
+- [ ] {number}.5 Final comprehensive validation
   - [SPECIFIC VALIDATION STEP]
   - [SPECIFIC VALIDATION STEP]
   - [SPECIFIC VALIDATION STEP]
   - [SPECIFIC VALIDATION STEP]
   - [SPECIFIC VALIDATION STEP]
 
-- [ ] [NUMBER].6 Create final summary report
+- [ ] {number}.6 Create final summary report
   - Create `/docs/reports/[TASK]_final_summary.md`
   - Include completion matrix
   - Document all working features
   - List any remaining limitations
   - Provide usage recommendations
 
-- [ ] [NUMBER].7 Mark task complete only if ALL sub-tasks pass
+- [ ] {number}.7 Mark task complete only if ALL sub-tasks pass
   - Verify 100% task completion
   - Confirm all reports show success
   - Ensure no critical issues remain
@@ -232,11 +274,11 @@ This task CANNOT be marked complete until ALL previous tasks are verified as COM
     
     "## Version Control Plan": """## Version Control Plan
 
-- **Initial Commit**: Create task-[NUMBER]-start tag before implementation
+- **Initial Commit**: Create task-{number}-start tag before implementation
 - **Feature Commits**: After each major feature
 - **Integration Commits**: After component integration  
 - **Test Commits**: After test suite completion
-- **Final Tag**: Create task-[NUMBER]-complete after all tests pass
+- **Final Tag**: Create task-{number}-complete after all tests pass
 
 """,
     
@@ -289,34 +331,72 @@ Each report must include:
 `/docs/reports/[TASK_NUMBER]_task_[SUBTASK]_[feature_name].md`
 """
 }
+TEMPLATE_SECTIONS = {sys.intern(name): template for name, template in TEMPLATE_SECTIONS.items()}
+
+# Order in which add_missing_sections inserts sections
+_SECTION_ORDER = tuple(sys.intern(section) for section in [
+    "# Task",
+    "**Objective**",
+    "**Requirements**",
+    "## Overview",
+    "## Research Summary",
+    "## MANDATORY Research Process",
+    "## Implementation Tasks",
+    "### Task",
+    "### Task Verification",
+    "## Usage Table",
+    "## Version Control Plan",
+    "## Resources",
+    "## Progress Tracking",
+    "## Report Documentation Requirements"
+])
+
+
+# Location of the template guide below a repository root
+_GUIDE_RELATIVE_PATH = os.path.join("docs", "memory_bank", "guides", "TASK_LIST_TEMPLATE_GUIDE.md")
+
+
+def _find_template_guide() -> Optional[str]:
+    """
+    Return the path of the Task Template Guide, or None if it cannot be found.
+    
+    CLAUDE_MCP_TEMPLATE_GUIDE overrides the search; otherwise the copy packaged
+    into the wheel, the repository containing this file, the current directory
+    and the legacy workspace checkout are tried in order.
+    """
+    override = os.environ.get("CLAUDE_MCP_TEMPLATE_GUIDE")
+    if override:
+        return override
+    
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    candidates = [
+        os.path.join(package_dir, "TASK_LIST_TEMPLATE_GUIDE.md"),
+        os.path.join(os.path.dirname(os.path.dirname(package_dir)), _GUIDE_RELATIVE_PATH),
+        os.path.join(os.getcwd(), _GUIDE_RELATIVE_PATH),
+        os.path.join(os.path.expanduser("~"), "workspace", "experiments", "claude-code-mcp", _GUIDE_RELATIVE_PATH),
+    ]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
 
 
+@functools.lru_cache(maxsize=1)
 def load_task_template_guide() -> str:
     """
     Load the Task Template Guide from the expected location.
     
+    The guide is read once per process; call load_task_template_guide.cache_clear()
+    to pick up an edited guide.
+    
     Returns:
         The content of the Task Template Guide markdown file.
     """
     try:
-        # Try to find the template guide relative to the current file
-        script_dir = Path(__file__).parent.parent.parent
-        template_path = script_dir / "docs" / "memory_bank" / "guides" / "TASK_LIST_TEMPLATE_GUIDE.md"
-        
-        if not template_path.exists():
-            # Try alternative locations if not found
-            alt_paths = [
-                Path.cwd() / "docs" / "memory_bank" / "guides" / "TASK_LIST_TEMPLATE_GUIDE.md",
-                Path.home() / "workspace" / "experiments" / "claude-code-mcp" / "docs" / "memory_bank" / "guides" / "TASK_LIST_TEMPLATE_GUIDE.md"
-            ]
-            
-            for path in alt_paths:
-                if path.exists():
-                    template_path = path
-                    break
-            else:
-                logger.warning("Could not find TASK_LIST_TEMPLATE_GUIDE.md, using default templates")
-                return ""
+        template_path = _find_template_guide()
+        if template_path is None:
+            logger.warning("Could not find TASK_LIST_TEMPLATE_GUIDE.md, using default templates")
+            return ""
         
         with open(template_path, 'r', encoding='utf-8') as file:
             return file.read()
@@ -325,31 +405,28 @@ def load_task_template_guide() -> str:
         return ""
 
 
-def check_required_sections(content: str) -> List[str]:
+def check_required_sections(content: str, lines: Optional[List[str]] = None) -> List[str]:
     """
     Check if all required sections are present in the markdown content.
     
     Args:
         content: The markdown content to check.
+        lines: content.splitlines(keepends=True), if the caller already has it.
         
     Returns:
         A list of missing section names.
     """
-    missing_sections = []
+    if lines is None:
+        lines = content.splitlines(keepends=True)
     
-    for section in REQUIRED_SECTIONS:
-        # Use fuzzy matching for section headers
-        if section.startswith("#"):
-            # For headers, check if a similar header exists
-            pattern = r"^" + re.escape(section.split(":")[0]).replace("\\#", "#\\s*") + r"[:\s]"
-            if not re.search(pattern, content, re.MULTILINE):
-                missing_sections.append(section)
-        else:
-            # For non-headers like **Objective**, check more directly
-            if section not in content:
-                missing_sections.append(section)
+    found = {section for section in _REQUIRED_MARKERS if section in content}
+    for line in lines:
+        if line.startswith("#"):
+            match = _REQUIRED_HEADERS_RE.match(line)
+            if match:
+                found.add(_REQUIRED_HEADER_GROUPS[match.lastgroup])
     
-    return missing_sections
+    return [section for section in REQUIRED_SECTIONS if section not in found]
 
 
 def extract_task_sections(content: str) -> Dict[str, List[str]]:
@@ -363,34 +440,39 @@ def extract_task_sections(content: str) -> Dict[str, List[str]]:
         A dictionary of section names to section content.
     """
     sections = {}
-    
-    # Extract main sections using regex
-    main_section_pattern = r"^(#+\s+[\w\s-]+)$|^(\*\*[\w\s-]+\*\*):"
-    matches = re.finditer(main_section_pattern, content, re.MULTILINE)
-    
-    # Get the positions of all section headers
-    positions = [(m.start(), m.group(0)) for m in matches]
-    positions.append((len(content), "EOF"))
-    
-    # Extract content between positions
-    for i in range(len(positions) - 1):
-        start_pos, header = positions[i]
-        end_pos = positions[i + 1][0]
-        
-        section_content = content[start_pos:end_pos].strip()
-        sections[header] = section_content
-    
-    # Extract task subsections
-    task_pattern = r"^(###\s+Task\s+\d+:.+?)(?=###\s+Task|$)"
-    task_matches = re.finditer(task_pattern, content, re.MULTILINE | re.DOTALL)
-    
     tasks = {}
-    for m in task_matches:
-        task_content = m.group(1).strip()
-        task_name = re.match(r"^###\s+(Task\s+\d+:.+?)$", task_content.split("\n")[0], re.MULTILINE)
+    header = section_start = task_start = None
+    
+    def add_task(end: int) -> None:
+        task_content = content[task_start:end].strip()
+        task_name = _TASK_NAME_RE.match(task_content.split("\n")[0])
         if task_name:
             tasks[task_name.group(1)] = task_content
     
+    # A single scan finds both the main sections and the task subsections
+    for m in _SECTION_SCAN_RE.finditer(content):
+        kind = m.lastgroup
+        
+        # A main section runs until the next section header or metadata marker
+        if kind in ("header", "meta"):
+            if header is not None:
+                sections[header] = content[section_start:m.start()].strip()
+            header, section_start = m.group(0), m.start()
+            if kind == "meta" or len(header) - len(header.lstrip("#")) > 3:
+                continue
+        
+        # A task runs until the next heading of level 1-3
+        if task_start is not None:
+            add_task(m.start())
+            task_start = None
+        if kind == "task":
+            task_start = m.start()
+    
+    if header is not None:
+        sections[header] = content[section_start:].strip()
+    if task_start is not None:
+        add_task(len(content))
+    
     # Add tasks to the sections
     sections["tasks"] = tasks
     
@@ -415,12 +497,11 @@ def detect_execution_modes(task_content: str) -> Tuple[str, List[str]]:
         execution_mode = "parallel"
     
     # Check for dependencies
-    dependency_pattern = r"depends\s+on:?\s+([^.\n]+)"
-    dependency_match = re.search(dependency_pattern, task_content, re.IGNORECASE)
+    dependency_match = _DEP_RE.search(task_content)
     if dependency_match:
         deps_text = dependency_match.group(1).strip()
         # Split by commas, 'and', or just spaces
-        deps = re.split(r',|\sand\s|\s+', deps_text)
+        deps = _DEP_SPLIT_RE.split(deps_text)
         dependencies = [d.strip() for d in deps if d.strip()]
     
     return execution_mode, dependencies
@@ -453,7 +534,7 @@ def add_execution_modes(task_sections: Dict[str, str]) -> Dict[str, str]:
         rest = "\n".join(lines[1:])
         
         # Add execution mode after priority/impact section if it exists
-        priority_match = re.search(r"\*\*Priority\*\*:.+?\*\*Impact\*\*:.+?$", rest, re.MULTILINE)
+        priority_match = _PRIORITY_LINE_RE.search(rest)
         if priority_match:
             insert_pos = priority_match.end()
             updated_content = (
@@ -470,26 +551,40 @@ def add_execution_modes(task_sections: Dict[str, str]) -> Dict[str, str]:
     return updated_tasks
 
 
-def build_dependency_graph(task_sections: Dict[str, str]) -> Dict[str, List[str]]:
+def _task_ids(task_names) -> Dict[str, str]:
+    """
+    Map task names like "Task 3: Build" to task IDs like "task-3".
+    
+    Args:
+        task_names: Iterable of task names.
+        
+    Returns:
+        Dictionary of task name to task ID, for names that carry a task number.
+    """
+    task_ids = {}
+    for task_name in task_names:
+        match = _TASK_NUM_RE.search(task_name)
+        if match:
+            task_ids[task_name] = f"task-{match.group(1)}"
+    return task_ids
+
+
+def build_dependency_graph(task_sections: Dict[str, str],
+                           task_ids: Optional[Dict[str, str]] = None) -> Dict[str, List[str]]:
     """
     Build a dependency graph from task descriptions.
     
     Args:
         task_sections: Dictionary of task name to task content.
+        task_ids: Task IDs from _task_ids(task_sections), if the caller already has them.
         
     Returns:
         Dictionary mapping task names to lists of dependent task names.
     """
-    dependencies = {}
-    
     # First pass: extract task IDs and information
-    task_ids = {}
-    for task_name in task_sections:
-        match = re.search(r"Task\s+(\d+)", task_name)
-        if match:
-            task_num = match.group(1)
-            task_ids[task_name] = f"task-{task_num}"
-            dependencies[f"task-{task_num}"] = []
+    if task_ids is None:
+        task_ids = _task_ids(task_sections)
+    dependencies = {task_id: [] for task_id in task_ids.values()}
     
     # Second pass: detect dependencies
     for task_name, task_content in task_sections.items():
@@ -502,7 +597,7 @@ def build_dependency_graph(task_sections: Dict[str, str]) -> Dict[str, List[str]
         # Convert dependency text to task IDs
         for dep in deps:
             # Try to match task number
-            match = re.search(r"Task\s+(\d+)", dep)
+            match = _TASK_NUM_RE.search(dep)
             if match:
                 dep_num = match.group(1)
                 dependencies[task_id].append(f"task-{dep_num}")
@@ -510,6 +605,27 @@ def build_dependency_graph(task_sections: Dict[str, str]) -> Dict[str, List[str]
     return dependencies
 
 
+def _splice(content: str, marker: str, insertion: str) -> str:
+    """
+    Insert text after the line holding the first occurrence of a marker.
+    
+    Args:
+        content: The markdown content to update.
+        marker: The text that locates the insertion line.
+        insertion: The text to insert.
+        
+    Returns:
+        The updated content, with the insertion appended if the marker is missing.
+    """
+    idx = content.find(marker)
+    if idx == -1:
+        return content + insertion
+    
+    line_end = content.find("\n", idx + len(marker))
+    pos = len(content) if line_end == -1 else line_end + 1
+    return content[:pos] + insertion + content[pos:]
+
+
 def add_missing_sections(content: str, missing_sections: List[str]) -> str:
     """
     Add missing sections to the markdown content.
@@ -524,36 +640,16 @@ def add_missing_sections(content: str, missing_sections: List[str]) -> str:
     updated_content = content
     
     # Determine task number
-    task_num_match = re.search(r"#\s*Task\s+(\d+)", updated_content)
+    task_num_match = _TITLE_NUM_RE.search(updated_content)
     task_num = task_num_match.group(1) if task_num_match else "001"
     
     # Get current task count to determine verification task number
-    task_count = len(re.findall(r"###\s+Task\s+\d+:", updated_content))
+    task_count = len(_SUBTASK_HEADER_RE.findall(updated_content))
     verification_task_num = task_count + 1 if task_count > 0 else 4
     
-    # Extract sections to determine insertion points
-    sections = extract_task_sections(updated_content)
-    
     # Process missing sections in a specific order
-    ordered_sections = [
-        "# Task",
-        "**Objective**",
-        "**Requirements**",
-        "## Overview",
-        "## Research Summary",
-        "## MANDATORY Research Process",
-        "## Implementation Tasks",
-        "### Task",
-        "### Task Verification",
-        "## Usage Table",
-        "## Version Control Plan",
-        "## Resources",
-        "## Progress Tracking",
-        "## Report Documentation Requirements"
-    ]
-    
-    # Filter ordered_sections to only include missing sections
-    ordered_missing = [s for s in ordered_sections if s in missing_sections]
+    missing = set(missing_sections)
+    ordered_missing = [s for s in _SECTION_ORDER if s in missing]
     
     for section in ordered_missing:
         template = TEMPLATE_SECTIONS.get(section, "")
@@ -567,54 +663,47 @@ def add_missing_sections(content: str, missing_sections: List[str]) -> str:
             # Add task section before or after existing content
             if "## Implementation Tasks" in updated_content:
                 # Add after implementation tasks
-                parts = updated_content.split("## Implementation Tasks")
-                before, after = parts[0], parts[1] if len(parts) > 1 else ""
-                template = template.replace("[NUMBER]", "1")
-                updated_content = f"{before}## Implementation Tasks\n\n{template}{after}"
+                template = template.format(number=1)
+                updated_content = _splice(updated_content, "## Implementation Tasks", f"\n{template}")
             else:
                 # Add at the end
-                template = template.replace("[NUMBER]", "1")
+                template = template.format(number=1)
                 updated_content += f"\n\n## Implementation Tasks\n\n{template}"
         
         elif section == "### Task Verification":
             # Add verification task
             if "## Implementation Tasks" in updated_content:
                 # Add after the last task
-                template = template.replace("[NUMBER]", str(verification_task_num))
+                template = template.format(number=verification_task_num)
                 # Find position after the last task
-                tasks = re.findall(r"###\s+Task\s+\d+:", updated_content)
-                if tasks:
-                    last_task = tasks[-1]
-                    parts = updated_content.split(last_task)
-                    before = parts[0] + last_task
-                    after = parts[1] if len(parts) > 1 else ""
-                    
+                matches = list(_SUBTASK_HEADER_RE.finditer(updated_content))
+                last_task = matches[-1] if matches else None
+                if last_task:
                     # Find end of the last task section
-                    next_section_match = re.search(r"^##\s+[^#]", after, re.MULTILINE)
+                    next_section_match = _NEXT_MAIN_SECTION_RE.search(updated_content, last_task.end())
                     if next_section_match:
-                        next_section_pos = next_section_match.start()
-                        updated_content = f"{before}{after[:next_section_pos]}\n\n{template}{after[next_section_pos:]}"
+                        pos = next_section_match.start()
+                        updated_content = f"{updated_content[:pos]}\n\n{template}{updated_content[pos:]}"
                     else:
-                        updated_content = f"{before}{after}\n\n{template}"
+                        updated_content += f"\n\n{template}"
                 else:
                     # No tasks yet, add after implementation tasks
-                    parts = updated_content.split("## Implementation Tasks")
-                    before, after = parts[0], parts[1] if len(parts) > 1 else ""
-                    updated_content = f"{before}## Implementation Tasks\n\n{template}{after}"
+                    updated_content = _splice(updated_content, "## Implementation Tasks", f"\n{template}")
             else:
                 # Add at the end
-                template = template.replace("[NUMBER]", str(verification_task_num))
+                template = template.format(number=verification_task_num)
                 updated_content += f"\n\n{template}"
         
         elif section in TEMPLATE_SECTIONS:
             # Generic section insertion
+            template = template.format(number=task_num)
             if section.startswith("##"):
                 # Main section (## heading)
                 updated_content += f"\n\n{template}"
             elif section.startswith("**"):
                 # Metadata section (**bold**)
                 # Insert after title if it exists
-                title_match = re.search(r"^#\s+Task.+?$", updated_content, re.MULTILINE)
+                title_match = _TITLE_LINE_RE.search(updated_content)
                 if title_match:
                     pos = title_match.end()
                     updated_content = f"{updated_content[:pos]}\n\n{template}{updated_content[pos:]}"
@@ -628,84 +717,88 @@ def add_missing_sections(content: str, missing_sections: List[str]) -> str:
     return updated_content
 
 
+def _split_tasks(content: str) -> List[Tuple[int, int, str]]:
+    """
+    Split the document into task sections.
+    
+    Args:
+        content: The markdown content to split.
+        
+    Returns:
+        A list of (start, end, text) triples, one per task section, in document order.
+    """
+    return [(m.start(), m.end(), m.group(1)) for m in _TASK_SECTION_RE.finditer(content)]
+
+
 def add_execution_info(content: str) -> str:
     """
     Add execution mode and dependency information to tasks.
     
+    The document is split into task sections once; updates are applied to the
+    sections and the document is joined back together at the end.
+    
     Args:
         content: The markdown content to update.
         
     Returns:
         Updated markdown content.
     """
-    sections = extract_task_sections(content)
-    task_sections = sections.get("tasks", {})
+    # Alternate the text between tasks with the task sections themselves. As in
+    # extract_task_sections, a repeated task name keeps its last section
+    parts = []
+    part_index = {}
+    task_sections = {}
+    last_end = 0
+    for start, end, text in _split_tasks(content):
+        parts.append(content[last_end:start])
+        name_match = _TASK_NAME_RE.match(text)
+        if name_match:
+            task_name = name_match.group(1)
+            task_sections[task_name] = text.strip()
+            part_index[task_name] = len(parts)
+        parts.append(text)
+        last_end = end
+    parts.append(content[last_end:])
     
     # Add execution modes
     updated_tasks = add_execution_modes(task_sections)
     
-    # Build dependency graph
-    dependencies = build_dependency_graph(task_sections)
+    # Build dependency graph; task numbers are parsed from the names only once
+    task_ids = _task_ids(task_sections)
+    dependencies = build_dependency_graph(task_sections, task_ids)
     
-    # Update content with execution modes and dependencies
-    updated_content = content
+    def replace_task(task_name: str, updated_task: str) -> None:
+        # Trailing blank lines stay in place so the section keeps its spacing
+        i = part_index[task_name]
+        parts[i] = updated_task + parts[i][len(parts[i].rstrip()):]
     
     for task_name, updated_task in updated_tasks.items():
         # Only replace if we actually made changes
-        if updated_task != task_sections.get(task_name, ""):
-            # Escape special characters for regex
-            safe_task_name = re.escape(task_name)
-            safe_original = re.escape(task_sections.get(task_name, ""))
-            
-            # Replace the task section with the updated version
-            pattern = f"(###\\s+{safe_task_name}.*?)(?=###\\s+Task|$)"
-            updated_content = re.sub(pattern, updated_task, updated_content, flags=re.DOTALL)
+        if updated_task != task_sections[task_name]:
+            replace_task(task_name, updated_task)
     
     # Add dependencies section to tasks if missing
-    for task_name, task_content in task_sections.items():
-        match = re.search(r"Task\s+(\d+)", task_name)
-        if not match:
-            continue
-            
-        task_num = match.group(1)
-        task_id = f"task-{task_num}"
-        
+    for task_name, task_id in task_ids.items():
+        task_content = task_sections[task_name]
         deps = dependencies.get(task_id, [])
         if deps and "depends" not in task_content.lower():
             # Find place to insert dependencies
             new_deps_line = f"\n**Dependencies**: {', '.join(deps)}\n"
+            current = parts[part_index[task_name]].rstrip()
             
-            # Try to insert after Execution Mode if it exists
-            if "**Execution Mode**" in task_content:
-                pattern = r"(\*\*Execution Mode\*\*:.+?)(\n\n|\n\*\*)"
-                match = re.search(pattern, task_content, re.DOTALL)
-                if match:
-                    pos = match.end(1)
-                    updated_task = task_content[:pos] + new_deps_line + task_content[pos:]
-                    
-                    # Escape special characters for regex
-                    safe_task_name = re.escape(task_name)
-                    
-                    # Replace the task section with the updated version
-                    pattern = f"(###\\s+{safe_task_name}.*?)(?=###\\s+Task|$)"
-                    updated_content = re.sub(pattern, updated_task, updated_content, flags=re.DOTALL)
-                    
-            # Try to insert after Priority/Impact section
-            elif "**Priority**" in task_content:
-                pattern = r"(\*\*Impact\*\*:.+?)(\n\n|\n\*\*)"
-                match = re.search(pattern, task_content, re.DOTALL)
-                if match:
-                    pos = match.end(1)
-                    updated_task = task_content[:pos] + new_deps_line + task_content[pos:]
-                    
-                    # Escape special characters for regex
-                    safe_task_name = re.escape(task_name)
-                    
-                    # Replace the task section with the updated version
-                    pattern = f"(###\\s+{safe_task_name}.*?)(?=###\\s+Task|$)"
-                    updated_content = re.sub(pattern, updated_task, updated_content, flags=re.DOTALL)
+            # Try to insert after Execution Mode if it exists, else after Priority/Impact
+            if "**Execution Mode**" in current:
+                match = _EXECUTION_MODE_FIELD_RE.search(current)
+            elif "**Priority**" in current:
+                match = _IMPACT_FIELD_RE.search(current)
+            else:
+                match = None
+            
+            if match:
+                pos = match.end(1)
+                replace_task(task_name, current[:pos] + new_deps_line + current[pos:])
     
-    return updated_content
+    return "".join(parts)
 
 
 def ensure_status_markers(content: str) -> str:
@@ -718,25 +811,10 @@ def ensure_status_markers(content: str) -> str:
     Returns:
         Updated markdown content.
     """
-    # Add status marker to main task title if missing
-    title_pattern = r"^(#\s+Task\s+\d+:[^#\n]+)$"
-    title_match = re.search(title_pattern, content, re.MULTILINE)
-    if title_match and "⏳" not in title_match.group(1) and "✅" not in title_match.group(1):
-        updated_title = f"{title_match.group(1)} ⏳ Not Started"
-        content = content.replace(title_match.group(1), updated_title)
-    
-    # Add status markers to subtasks if missing
-    subtask_pattern = r"^(###\s+Task\s+\d+:[^#\n]+)$"
-    
-    def replace_subtask_title(match):
-        title = match.group(1)
-        if "⏳" not in title and "✅" not in title:
-            return f"{title} ⏳ Not Started"
-        return title
-    
-    content = re.sub(subtask_pattern, replace_subtask_title, content, flags=re.MULTILINE)
-    
-    return content
+    # One pass over the lines; a document that already has every marker is
+    # returned without being copied
+    lines = content.splitlines(keepends=True)
+    return "".join(lines) if _amend_lines(lines, checkboxes=False) else content
 
 
 def ensure_checkboxes(content: str) -> str:
@@ -749,17 +827,88 @@ def ensure_checkboxes(content: str) -> str:
     Returns:
         Updated markdown content.
     """
-    # Find all task step lists without checkboxes
-    step_pattern = r"^(\s*-\s+)([^[\]\n]+)$"
+    # Find all task step lists without checkboxes; usually there are none left
+    if not _STEP_RE.search(content):
+        return content
+    
+    # _STEP_RE never matches a line holding brackets, so every match lacks a
+    # checkbox. A minimal callback beats a "\1[ ] \2" template, which re expands
+    # in Python for every match before 3.12
+    return _STEP_RE.sub(lambda m: f"{m[1]}[ ] {m[2]}", content)
+
+
+def _amend_lines(lines: List[str], checkboxes: bool = True) -> bool:
+    """
+    Apply ensure_status_markers and ensure_checkboxes to a list of lines in one pass.
+    
+    Args:
+        lines: The markdown lines, with line endings, updated in place.
+        checkboxes: Whether to add checkboxes as well as status markers.
+        
+    Returns:
+        True if any line was changed.
+    """
+    changed = False
+    saw_title = False
+    for i, line in enumerate(lines):
+        text = line.rstrip("\n")
+        if text.startswith("#"):
+            # Only the first task title is the main title; every subtask is marked
+            if not saw_title and _TITLE_RE.match(text):
+                saw_title = True
+            elif not _SUBTASK_RE.match(text):
+                continue
+            if "⏳" not in text and "✅" not in text:
+                lines[i] = f"{text} ⏳ Not Started{line[len(text):]}"
+                changed = True
+        elif checkboxes:
+            step_match = _STEP_RE.match(text)
+            if step_match:
+                lines[i] = f"{step_match.group(1)}[ ] {step_match.group(2)}{line[len(text):]}"
+                changed = True
+    return changed
+
+
+def amend_task_content(content: str) -> str:
+    """
+    Amend task list markdown in memory to conform to the template guide.
     
-    def replace_step(match):
-        prefix = match.group(1)
-        step = match.group(2)
-        if not step.strip().startswith("[ ]") and not step.strip().startswith("[x]"):
-            return f"{prefix}[ ] {step}"
-        return match.group(0)
+    Args:
+        content: The markdown content to amend.
+        
+    Returns:
+        The amended markdown content.
+    """
+    # The section check and the marker pass share one split of the document,
+    # unless the sections added in between change it
+    lines = content.splitlines(keepends=True)
+    
+    # Check required sections
+    missing_sections = check_required_sections(content, lines)
+    
+    # First add execution info to existing tasks, then add missing sections.
+    # Both run before the marker pass so that template bullets get their
+    # checkboxes now; amending an amended document then changes nothing
+    updated_content = add_execution_info(content)
+    if missing_sections:
+        updated_content = add_missing_sections(updated_content, missing_sections)
+    if updated_content != content:
+        content = updated_content
+        lines = content.splitlines(keepends=True)
+    
+    # Ensure status markers and checkboxes in a single pass over the lines
+    if _amend_lines(lines):
+        content = "".join(lines)
     
-    return re.sub(step_pattern, replace_step, content, flags=re.MULTILINE)
+    return content
+
+
+def _same_file(path: str, other_path: str) -> bool:
+    """Return True if both paths name the same existing file."""
+    try:
+        return os.path.samefile(path, other_path)
+    except OSError:
+        return False
 
 
 def amend_task_list(markdown_path: str, output_path: Optional[str] = None) -> str:
@@ -778,26 +927,28 @@ def amend_task_list(markdown_path: str, output_path: Optional[str] = None) -> st
         with open(markdown_path, 'r', encoding='utf-8') as file:
             content = file.read()
         
-        # Check required sections
-        missing_sections = check_required_sections(content)
-        
-        # First add execution info to existing tasks
-        content = add_execution_info(content)
-        
-        # Then add missing sections
-        if missing_sections:
-            content = add_missing_sections(content, missing_sections)
+        amended_content = amend_task_content(content)
         
-        # Ensure status markers
-        content = ensure_status_markers(content)
+        # A file that already conforms is left untouched when amending in place,
+        # so re-running over a directory of task lists rewrites nothing
+        if output_path and amended_content == content and _same_file(markdown_path, output_path):
+            logger.info(f"Task list {output_path} already conforms to the template guide")
+            return amended_content
+        content = amended_content
         
-        # Ensure checkboxes
-        content = ensure_checkboxes(content)
-        
-        # Save amended file if output path provided
+        # Save amended file if output path provided. The content goes to a
+        # temporary file that is renamed into place, so a failed write never
+        # leaves a truncated task list (output_path is often the input file)
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                file.write(content)
+            temp_path = f"{output_path}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as file:
+                    file.write(content)
+                os.replace(temp_path, output_path)
+            except OSError:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
             logger.info(f"Amended task list saved to {output_path}")
         
         return content
@@ -807,31 +958,71 @@ def amend_task_list(markdown_path: str, output_path: Optional[str] = None) -> st
         raise
 
 
+def _amend_in_place(markdown_path: str) -> Optional[str]:
+    """
+    Amend one task list in place for a batch run.
+    
+    This is a module-level function so process pool workers can unpickle it.
+    
+    Args:
+        markdown_path: Path to the markdown file.
+        
+    Returns:
+        None on success, otherwise the error message.
+    """
+    try:
+        amend_task_list(markdown_path, markdown_path)
+        return None
+    except Exception as e:
+        return str(e)
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description='Amend task lists to conform to the template guide.')
-    parser.add_argument('input_file', help='Path to the input markdown file')
-    parser.add_argument('-o', '--output', help='Path to save the amended file (defaults to overwriting input)')
+    parser.add_argument('input_files', nargs='+', metavar='input_file', help='Path to an input markdown file; several files are amended in parallel')
+    parser.add_argument('-o', '--output', help='Path to save the amended file (defaults to overwriting input; single input only)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose logging')
     
     args = parser.parse_args()
+    if args.output and len(args.input_files) > 1:
+        parser.error("--output can only be used with a single input file")
     
     # Configure logging
     log_level = "DEBUG" if args.verbose else "INFO"
     logger.remove()
     logger.add(sys.stderr, level=log_level)
     
-    # Default output to input if not specified
-    output_path = args.output or args.input_file
+    if len(args.input_files) == 1:
+        # Default output to input if not specified
+        input_file = args.input_files[0]
+        output_path = args.output or input_file
+        
+        # Amend task list
+        try:
+            amended_content = amend_task_list(input_file, output_path)
+            print(f"Task list amended successfully and saved to {output_path}")
+        except Exception as e:
+            logger.error(f"Failed to amend task list: {e}")
+            sys.exit(1)
+        return
+    
+    # Files are independent and amending is CPU-bound, so spread them over processes
+    workers = min(len(args.input_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        errors = list(pool.map(_amend_in_place, args.input_files))
+    
+    failed = 0
+    for input_file, error in zip(args.input_files, errors, strict=True):
+        if error is None:
+            print(f"Task list amended successfully and saved to {input_file}")
+        else:
+            failed += 1
+            logger.error(f"Failed to amend {input_file}: {error}")
     
-    # Amend task list
-    try:
-        amended_content = amend_task_list(args.input_file, output_path)
-        print(f"Task list amended successfully and saved to {output_path}")
-    except Exception as e:
-        logger.error(f"Failed to amend task list: {e}")
+    if failed:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
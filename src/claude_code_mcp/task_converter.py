@@ -3,6 +3,8 @@ Task Converter for Claude Code MCP task orchestration system.
 
 This module provides functionality for converting markdown task descriptions into
 structured JSON format for execution by the task orchestration system.
+Parsed tasks already match the Task model, so they are only re-validated with
+Pydantic when CLAUDE_MCP_VALIDATE=1.
 
 Documentation:
 - Markdown: https://python-markdown.github.io/
@@ -16,15 +18,50 @@ Expected Output:
   JSON representation of the task structure with metadata, subtasks, and verification requirements
 """
 
-import json
+import functools
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
+import orjson
 from loguru import logger
 from pydantic import BaseModel, Field, validator
 
+# Patterns used by parse_task_from_str, compiled once at import time
+_HEADER_RE = re.compile(r"# Task (\d+): (.*?)( ⏳.*)?$", re.MULTILINE)
+_OBJECTIVE_RE = re.compile(r"\*\*Objective\*\*:\s*(.*?)(?=\n\n|\*\*Requirements\*\*)", re.DOTALL)
+_REQUIREMENTS_RE = re.compile(r"\*\*Requirements\*\*:\s*(.*?)(?=\n\n|\#\# )", re.DOTALL)
+_REQUIREMENT_ITEM_RE = re.compile(r"\d+\.\s*(.*?)(?=\n\d+\.|\n\n|\Z)", re.DOTALL)
+_OVERVIEW_RE = re.compile(r"## Overview\s*(.*?)(?=\n\n\*\*IMPORTANT\*\*|\n\n## )", re.DOTALL)
+# Section bodies run until a delimiter that always starts a line. Rather than
+# retrying the delimiter lookahead after every character, these patterns take
+# whole lines at once and only test for a delimiter at each newline, so a
+# body is consumed in a single linear pass
+_SUBTASK_RE = re.compile(r"### Task (\d+): (.*?)( ⏳.*?)?\s*\n\n([^\n]*(?:\n(?!### Task|## |\Z)[^\n]*)*)", re.DOTALL)
+_STEPS_SECTION_RE = re.compile(
+    r"\*\*Implementation Steps\*\*:\s*"
+    r"([^\n]*(?:(?!\n\n\*\*Technical Specifications\*\*|\n\n\*\*Verification Method\*\*|\n\n\*\*CLI Testing)\n[^\n]*)*)"
+)
+_STEP_RE = re.compile(r"- \[ \] (\d+\.\d+) ([^\n]*(?:\n(?!  - |- \[ \]|\n)[^\n]*)*)")
+_SUBSTEP_RE = re.compile(r"  - (.*?)(?=\n  - |\n- \[ \]|\n\n|\Z)", re.DOTALL)
+_RESOURCES_RE = re.compile(r"## Resources\s*([^\n]*(?:(?!\n\n## )\n(?!\Z)[^\n]*)*)")
+_PACKAGES_RE = re.compile(r"\*\*Python Packages\*\*:\s*(.*?)(?=\n\n\*\*|\Z)", re.DOTALL)
+_PACKAGE_ITEM_RE = re.compile(r"- (.*?)(?=\n-|\Z)")
+_DOCS_RE = re.compile(r"\*\*Documentation\*\*:\s*(.*?)(?=\n\n\*\*|\Z)", re.DOTALL)
+_EXAMPLES_RE = re.compile(r"\*\*Example Implementations\*\*:\s*(.*?)(?=\n\n\*\*|\Z)", re.DOTALL)
+_LINK_ITEM_RE = re.compile(r"- \[(.*?)\]\((.*?)\)")
+_USAGE_TABLE_RE = re.compile(
+    r"## Usage Table\s*\n\|\s*Command / Function\s*\|\s*Description\s*\|\s*Example Usage\s*\|\s*Expected Output\s*\|\s*\n\|[-\s]*\|\s*[-\s]*\|\s*[-\s]*\|\s*[-\s]*\|\s*"
+    r"([^\n]*(?:(?!\n\n## )\n(?!\Z)[^\n]*)*)"
+)
+
+# Accepted values for TaskMetadata.status and TaskMetadata.priority
+_VALID_STATUSES = frozenset(("not_started", "in_progress", "completed", "blocked"))
+_VALID_PRIORITIES = frozenset(("low", "medium", "high", "critical"))
+
 class TaskMetadata(BaseModel):
     """Task metadata model for validation and serialization."""
     task_id: str
@@ -35,18 +72,18 @@ class TaskMetadata(BaseModel):
     @validator("status")
     def validate_status(cls, v: str) -> str:
         """Validate task status."""
-        valid_statuses = ["not_started", "in_progress", "completed", "blocked"]
-        if v.lower() not in valid_statuses:
-            raise ValueError(f"Status must be one of {valid_statuses}")
-        return v.lower()
+        status = v.lower()
+        if status not in _VALID_STATUSES:
+            raise ValueError(f"Status must be one of {sorted(_VALID_STATUSES)}")
+        return status
     
     @validator("priority")
     def validate_priority(cls, v: str) -> str:
         """Validate task priority."""
-        valid_priorities = ["low", "medium", "high", "critical"]
-        if v.lower() not in valid_priorities:
-            raise ValueError(f"Priority must be one of {valid_priorities}")
-        return v.lower()
+        priority = v.lower()
+        if priority not in _VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of {sorted(_VALID_PRIORITIES)}")
+        return priority
 
 
 class SubTask(BaseModel):
@@ -70,36 +107,64 @@ class Task(BaseModel):
     usage_examples: List[Dict[str, str]] = []
 
 
-def parse_task_from_markdown(markdown_path: Path) -> Dict[str, Any]:
+def read_task_markdown(markdown_path: Path) -> str:
     """
-    Parse a markdown file into a structured task dictionary.
+    Read a markdown task file, decoding it as UTF-8 or else latin-1.
+    
+    The file is read once as bytes. latin-1 can decode any byte sequence, so
+    it is the only fallback that is ever needed.
     
     Args:
         markdown_path: Path to the markdown file containing task description
         
     Returns:
-        Dictionary representation of the task structure
+        The decoded markdown content with universal newlines
     """
     try:
-        # Try different encodings
-        for encoding in ["utf-8", "latin-1", "cp1252"]:
-            try:
-                content = markdown_path.read_text(encoding=encoding)
-                logger.info(f"Successfully read file using {encoding} encoding")
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            # If all encodings fail, try binary mode and detect encoding
-            with open(markdown_path, 'rb') as f:
-                content = f.read().decode('utf-8', errors='replace')
-                logger.warning(f"Used fallback encoding with replacement characters")
+        raw = markdown_path.read_bytes()
     except Exception as e:
         logger.error(f"Error reading markdown file: {e}")
         raise ValueError(f"Could not read markdown file: {e}")
     
+    try:
+        content = raw.decode("utf-8")
+        logger.info("Successfully read file using utf-8 encoding")
+    except UnicodeDecodeError:
+        content = raw.decode("latin-1")
+        logger.warning("Markdown file is not valid UTF-8; read it as latin-1")
+    
+    # Translate line endings as read_text() would; the parser expects "\n"
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    
+    return content
+
+
+def parse_task_from_markdown(markdown_path: Path) -> Dict[str, Any]:
+    """
+    Parse a markdown file into a structured task dictionary.
+    
+    Args:
+        markdown_path: Path to the markdown file containing task description
+        
+    Returns:
+        Dictionary representation of the task structure
+    """
+    return parse_task_from_str(read_task_markdown(markdown_path))
+
+
+def parse_task_from_str(content: str) -> Dict[str, Any]:
+    """
+    Parse already-loaded markdown content into a structured task dictionary.
+    
+    Args:
+        content: Markdown task description
+        
+    Returns:
+        Dictionary representation of the task structure
+    """
     # Extract task ID and title from first line
-    header_match = re.search(r"# Task (\d+): (.*?)( ⏳.*)?$", content, re.MULTILINE)
+    header_match = _HEADER_RE.search(content)
     if not header_match:
         raise ValueError("Could not find task ID and title in the first line")
     
@@ -108,21 +173,21 @@ def parse_task_from_markdown(markdown_path: Path) -> Dict[str, Any]:
     status = "not_started"  # Default status
     
     # Extract objective
-    objective_match = re.search(r"\*\*Objective\*\*:\s*(.*?)(?=\n\n|\*\*Requirements\*\*)", content, re.DOTALL)
+    objective_match = _OBJECTIVE_RE.search(content)
     if not objective_match:
         raise ValueError("Could not find objective section")
     objective = objective_match.group(1).strip()
     
     # Extract requirements
-    requirements_section = re.search(r"\*\*Requirements\*\*:\s*(.*?)(?=\n\n|\#\# )", content, re.DOTALL)
+    requirements_section = _REQUIREMENTS_RE.search(content)
     if not requirements_section:
         raise ValueError("Could not find requirements section")
     
     requirements_text = requirements_section.group(1)
-    requirements = [req.strip() for req in re.findall(r"\d+\.\s*(.*?)(?=\n\d+\.|\n\n|\Z)", requirements_text, re.DOTALL)]
+    requirements = [req.strip() for req in _REQUIREMENT_ITEM_RE.findall(requirements_text)]
     
     # Extract overview
-    overview_match = re.search(r"## Overview\s*(.*?)(?=\n\n\*\*IMPORTANT\*\*|\n\n## )", content, re.DOTALL)
+    overview_match = _OVERVIEW_RE.search(content)
     if not overview_match:
         raise ValueError("Could not find overview section")
     overview = overview_match.group(1).strip()
@@ -130,34 +195,37 @@ def parse_task_from_markdown(markdown_path: Path) -> Dict[str, Any]:
     # Extract subtasks
     subtasks = []
     try:
-        subtask_sections = re.finditer(r"### Task (\d+): (.*?)( ⏳.*?)?\s*\n\n(.*?)(?=\n### Task|\n## |$)", content, re.DOTALL)
+        subtask_sections = _SUBTASK_RE.finditer(content)
         
         for match in subtask_sections:
             try:
                 subtask_id = match.group(1)
-                subtask_title = match.group(2).strip() if isinstance(match.group(2), str) else str(match.group(2))
+                subtask_title = match.group(2).strip()
                 subtask_content = match.group(4)
                 
                 # Extract steps
                 steps = []
-                steps_section = re.search(r"\*\*Implementation Steps\*\*:\s*(.*?)(?=\n\n\*\*Technical Specifications\*\*|\n\n\*\*Verification Method\*\*|\n\n\*\*CLI Testing|\Z)", subtask_content, re.DOTALL)
+                steps_section = _STEPS_SECTION_RE.search(subtask_content)
                 
                 if steps_section:
                     steps_text = steps_section.group(1)
                     
                     # Extract individual steps with their sub-steps
-                    step_matches = re.finditer(r"- \[ \] (\d+\.\d+) (.*?)(?=\n  - |\n- \[ \]|\n\n|\Z)", steps_text, re.DOTALL)
+                    step_matches = _STEP_RE.finditer(steps_text)
                     for step_match in step_matches:
                         try:
                             step_id = step_match.group(1)
-                            step_title = step_match.group(2).strip() if isinstance(step_match.group(2), str) else ""
+                            step_title = step_match.group(2).strip()
                             
-                            # Extract substeps if any
+                            # Extract substeps if any, collecting the pieces for a single join
                             substep_text = ""
-                            substep_matches = re.finditer(r"  - (.*?)(?=\n  - |\n- \[ \]|\n\n|\Z)", step_match.group(0), re.DOTALL)
-                            for substep_match in substep_matches:
-                                substep = substep_match.group(1).strip() if isinstance(substep_match.group(1), str) else ""
-                                substep_text += f"\n  - {substep}"
+                            step_text = step_match.group(0)
+                            if "  - " in step_text:
+                                substep_parts = []
+                                for substep_match in _SUBSTEP_RE.finditer(step_text):
+                                    substep = substep_match.group(1).strip()
+                                    substep_parts.append(f"\n  - {substep}")
+                                substep_text = "".join(substep_parts)
                             
                             steps.append(f"{step_id} {step_title}{substep_text}")
                         except Exception as e:
@@ -188,45 +256,50 @@ def parse_task_from_markdown(markdown_path: Path) -> Dict[str, Any]:
     
     # Extract resources
     resources = {}
-    resources_section = re.search(r"## Resources\s*(.*?)(?=\n\n## |$)", content, re.DOTALL)
+    resources_section = _RESOURCES_RE.search(content)
     if resources_section:
         resources_content = resources_section.group(1)
         
         # Extract Python packages
-        packages_match = re.search(r"\*\*Python Packages\*\*:\s*(.*?)(?=\n\n\*\*|\Z)", resources_content, re.DOTALL)
+        packages_match = _PACKAGES_RE.search(resources_content)
         if packages_match:
             packages_text = packages_match.group(1)
-            packages = [pkg.strip() for pkg in re.findall(r"- (.*?)(?=\n-|\Z)", packages_text)]
+            packages = [pkg.strip() for pkg in _PACKAGE_ITEM_RE.findall(packages_text)]
             resources["python_packages"] = packages
         
         # Extract documentation links
-        docs_match = re.search(r"\*\*Documentation\*\*:\s*(.*?)(?=\n\n\*\*|\Z)", resources_content, re.DOTALL)
+        docs_match = _DOCS_RE.search(resources_content)
         if docs_match:
             docs_text = docs_match.group(1)
-            docs = [doc.strip() for doc in re.findall(r"- \[(.*?)\]\((.*?)\)", docs_text)]
+            docs = [doc.strip() for doc in _LINK_ITEM_RE.findall(docs_text)]
             resources["documentation"] = [f"{name}: {url}" for name, url in docs]
         
         # Extract example implementations
-        examples_match = re.search(r"\*\*Example Implementations\*\*:\s*(.*?)(?=\n\n\*\*|\Z)", resources_content, re.DOTALL)
+        examples_match = _EXAMPLES_RE.search(resources_content)
         if examples_match:
             examples_text = examples_match.group(1)
-            examples = [ex.strip() for ex in re.findall(r"- \[(.*?)\]\((.*?)\)", examples_text)]
+            examples = [ex.strip() for ex in _LINK_ITEM_RE.findall(examples_text)]
             resources["examples"] = [f"{name}: {url}" for name, url in examples]
     
     # Extract usage examples
     usage_examples = []
-    usage_section = re.search(r"## Usage Table\s*\n\|\s*Command / Function\s*\|\s*Description\s*\|\s*Example Usage\s*\|\s*Expected Output\s*\|\s*\n\|[-\s]*\|\s*[-\s]*\|\s*[-\s]*\|\s*[-\s]*\|\s*(.*?)(?=\n\n## |$)", content, re.DOTALL)
+    usage_section = _USAGE_TABLE_RE.search(content)
     
     if usage_section:
-        usage_content = usage_section.group(1)
-        usage_rows = re.findall(r"\|\s*(.*?)\s*\|\s*(.*?)\s*\|\s*(.*?)\s*\|\s*(.*?)\s*\|", usage_content)
-        
-        for command, description, example, output in usage_rows:
+        # Rows have a fixed "| a | b | c | d |" shape, so plain splits do
+        for line in usage_section.group(1).splitlines():
+            cells = [cell.strip() for cell in line.split("|")[1:-1]]
+            if len(cells) != 4:
+                continue
+            command, description, example, output = cells
+            if command and not command.strip("-:"):
+                # Separator row
+                continue
             usage_examples.append({
-                "command": command.strip(),
-                "description": description.strip(),
-                "example": example.strip(),
-                "expected_output": output.strip()
+                "command": command,
+                "description": description,
+                "example": example,
+                "expected_output": output
             })
     
     # Create task dictionary
@@ -252,6 +325,9 @@ def convert_task(markdown_path: str, output_path: Optional[str] = None) -> Dict[
     """
     Convert a markdown task description to JSON format.
     
+    Conversions are memoized by path, modification time and size, so
+    converting an unchanged file again skips reading and parsing it.
+    
     Args:
         markdown_path: Path to the markdown file
         output_path: Optional path to save the JSON output
@@ -259,28 +335,119 @@ def convert_task(markdown_path: str, output_path: Optional[str] = None) -> Dict[
     Returns:
         Dictionary representation of the task
     """
-    path = Path(markdown_path)
-    if not path.exists():
+    try:
+        st = os.stat(markdown_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"Markdown file not found: {markdown_path}")
     
-    # Parse markdown into task dictionary
-    task_dict = parse_task_from_markdown(path)
+    task_dict = orjson.loads(_convert_cached(str(markdown_path), st.st_mtime_ns, st.st_size))
     
-    try:
-        # Validate with Pydantic model
-        task = Task(**task_dict)
-        validated_dict = task.dict()
-    except Exception as e:
-        logger.error(f"Validation error: {e}")
-        raise ValueError(f"Task validation failed: {e}")
+    # Write to output file if specified
+    if output_path:
+        write_task_json(task_dict, output_path)
+    
+    return task_dict
+
+
+@functools.lru_cache(maxsize=128)
+def _convert_cached(markdown_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Convert a markdown task file to JSON, memoized by path and file identity.
+    
+    The modification time and size are part of the key, so editing the file
+    makes the next call convert it again. The JSON bytes are cached rather
+    than the dictionary so that every caller gets its own copy to modify.
+    """
+    task_dict = _validate_and_write(parse_task_from_markdown(Path(markdown_path)), None)
+    return orjson.dumps(task_dict)
+
+
+def convert_tasks(markdown_paths: List[str], workers: Optional[int] = None,
+                  output_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Convert several markdown task files, spreading them over processes.
+    
+    Files are independent and conversion is CPU-bound, so each worker process
+    runs convert_task on its share of the files.
+    
+    Args:
+        markdown_paths: Paths to the markdown files
+        workers: Maximum number of worker processes (default: one per CPU)
+        output_dir: Optional directory to save each task in as <file stem>.json
+        
+    Returns:
+        Task dictionaries in the same order as markdown_paths
+    """
+    output_paths: List[Optional[str]] = [None] * len(markdown_paths)
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        output_paths = [str(Path(output_dir) / f"{Path(path).stem}.json") for path in markdown_paths]
+    
+    workers = min(len(markdown_paths), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [
+            convert_task(path, output)
+            for path, output in zip(markdown_paths, output_paths, strict=True)
+        ]
+    
+    # Hand files out a few at a time to amortize inter-process overhead
+    chunksize = max(1, min(8, len(markdown_paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(convert_task, markdown_paths, output_paths, chunksize=chunksize))
+
+
+def convert_task_from_str(content: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Convert already-loaded markdown task content to JSON format.
+    
+    Args:
+        content: Markdown task description
+        output_path: Optional path to save the JSON output
+        
+    Returns:
+        Dictionary representation of the task
+    """
+    return _validate_and_write(parse_task_from_str(content), output_path)
+
+
+def _validation_enabled() -> bool:
+    """Return True if parsed tasks should be re-validated against the Task model."""
+    return os.environ.get("CLAUDE_MCP_VALIDATE") == "1"
+
+
+def _validate_and_write(task_dict: Dict[str, Any], output_path: Optional[str]) -> Dict[str, Any]:
+    """
+    Optionally validate a parsed task dictionary and write it as JSON.
+    
+    task_dict must come from parse_task_from_str, which only ever builds the
+    Task schema with normalized status and priority values, so the Pydantic
+    round trip is skipped unless CLAUDE_MCP_VALIDATE=1. JSON from any other
+    source has to go through Task.model_validate instead.
+    """
+    if _validation_enabled():
+        try:
+            task_dict = Task.model_validate(task_dict).model_dump()
+        except Exception as e:
+            logger.error(f"Validation error: {e}")
+            raise ValueError(f"Task validation failed: {e}")
     
     # Write to output file if specified
     if output_path:
-        output = Path(output_path)
-        output.write_text(json.dumps(validated_dict, indent=2), encoding="utf-8")
-        logger.info(f"Task JSON written to {output_path}")
+        write_task_json(task_dict, output_path)
+    
+    return task_dict
+
+
+def write_task_json(task_dict: Dict[str, Any], output_path: str) -> None:
+    """
+    Write a converted task to a JSON file.
     
-    return validated_dict
+    Args:
+        task_dict: Validated task dictionary
+        output_path: Path to save the JSON output
+    """
+    Path(output_path).write_bytes(orjson.dumps(task_dict, option=orjson.OPT_INDENT_2))
+    logger.info(f"Task JSON written to {output_path}")
 
 
 if __name__ == "__main__":
@@ -345,6 +512,28 @@ if __name__ == "__main__":
     except Exception as e:
         all_validation_failures.append(f"Status validation test failed with unexpected error: {str(e)}")
     
+    # Test batch conversion across processes
+    total_tests += 1
+    try:
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            markdown = (
+                "# Task {n}: Batch Task {n}\n\n**Objective**: Convert in bulk\n\n"
+                "**Requirements**:\n1. Keep order\n\n## Overview\n\nBatch conversion test\n\n## Resources\n"
+            )
+            paths = []
+            for n in (1, 2, 3):
+                path = Path(tmp_dir) / f"{n:03d}_batch.md"
+                path.write_text(markdown.format(n=n), encoding="utf-8")
+                paths.append(str(path))
+            
+            results = convert_tasks(paths, workers=2, output_dir=str(Path(tmp_dir) / "json"))
+            assert [r["metadata"]["task_id"] for r in results] == ["1", "2", "3"], "Batch results out of order"
+            assert (Path(tmp_dir) / "json" / "002_batch.json").exists(), "Batch JSON output not written"
+    except Exception as e:
+        all_validation_failures.append(f"Batch conversion test failed: {str(e)}")
+    
     # Final validation result
     if all_validation_failures:
         print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
@@ -7,7 +7,7 @@ their dependencies and specified execution modes.
 
 Documentation:
 - asyncio: https://docs.python.org/3/library/asyncio.html
-- networkx: https://networkx.org/documentation/stable/index.html
+- Topological sorting (Kahn's algorithm): https://en.wikipedia.org/wiki/Topological_sorting
 
 Sample Input:
   tasks = [
@@ -24,7 +24,6 @@ Expected Output:
 import asyncio
 from enum import Enum
 from typing import Dict, List, Set, Any, Optional
-import networkx as nx
 from loguru import logger
 
 from claude_code_mcp.task_executor import ExecutionMode, TaskStatus
@@ -46,7 +45,11 @@ class TaskDependencyManager:
     
     def __init__(self):
         """Initialize the dependency manager."""
-        self.dependency_graph = nx.DiGraph()
+        # Direct dependencies (in declaration order) and execution mode of
+        # every declared task. Dependencies may name tasks that were never
+        # declared; validate_dependencies reports those
+        self._preds: Dict[str, List[str]] = {}
+        self._modes: Dict[str, str] = {}
         
     def add_task(self, task_id: str, dependencies: List[str], execution_mode: str = "sequential"):
         """
@@ -57,15 +60,54 @@ class TaskDependencyManager:
             dependencies: List of task IDs this task depends on
             execution_mode: "sequential" or "parallel"
         """
-        # Add the task node with attributes
-        self.dependency_graph.add_node(
-            task_id, 
-            execution_mode=execution_mode
-        )
-        
-        # Add dependency edges
+        preds = self._preds.setdefault(task_id, [])
         for dep in dependencies:
-            self.dependency_graph.add_edge(dep, task_id)
+            if dep not in preds:
+                preds.append(dep)
+        self._modes[task_id] = execution_mode
+    
+    def _missing_dependencies(self) -> List[str]:
+        """Describe every dependency on a task that was never declared."""
+        return [
+            f"Task {task_id} depends on missing task {dep}"
+            for task_id, preds in self._preds.items()
+            for dep in preds
+            if dep not in self._preds
+        ]
+    
+    def _ready_layers(self) -> List[List[str]]:
+        """
+        Order the declared tasks into layers with Kahn's algorithm.
+        
+        Each layer holds the tasks whose dependencies all sit in earlier
+        layers. Dependencies on undeclared tasks are ignored, and tasks on or
+        behind a cycle end up in no layer at all.
+        
+        Returns:
+            List of layers, each a list of task IDs in declaration order
+        """
+        indeg: Dict[str, int] = {}
+        succs: Dict[str, List[str]] = {task_id: [] for task_id in self._preds}
+        for task_id, preds in self._preds.items():
+            declared = [dep for dep in preds if dep in succs]
+            indeg[task_id] = len(declared)
+            for dep in declared:
+                succs[dep].append(task_id)
+        
+        # Indegrees are decremented as each layer completes, so a task joins
+        # the next layer as soon as its last dependency has been placed
+        layers = []
+        ready = [task_id for task_id, degree in indeg.items() if degree == 0]
+        while ready:
+            layers.append(ready)
+            next_ready = []
+            for task_id in ready:
+                for succ in succs[task_id]:
+                    indeg[succ] -= 1
+                    if indeg[succ] == 0:
+                        next_ready.append(succ)
+            ready = next_ready
+        return layers
     
     def validate_dependencies(self) -> List[str]:
         """
@@ -77,18 +119,11 @@ class TaskDependencyManager:
         errors = []
         
         # Check for cycles
-        try:
-            nx.find_cycle(self.dependency_graph)
+        if sum(len(layer) for layer in self._ready_layers()) < len(self._preds):
             errors.append("Dependency cycle detected in tasks")
-        except nx.NetworkXNoCycle:
-            # No cycle found, this is good
-            pass
         
         # Check for missing dependencies
-        for node in self.dependency_graph.nodes:
-            for predecessor in self.dependency_graph.predecessors(node):
-                if predecessor not in self.dependency_graph.nodes:
-                    errors.append(f"Task {node} depends on missing task {predecessor}")
+        errors.extend(self._missing_dependencies())
         
         return errors
     
@@ -104,46 +139,33 @@ class TaskDependencyManager:
             
         Returns:
             List of task groups, where each group is a list of task IDs that can run in parallel
+            
+        Raises:
+            TaskDependencyError: If a task depends on an undeclared task or the
+                dependencies form a cycle
         """
-        # Clear any existing graph
-        self.dependency_graph.clear()
-        
-        # Add all tasks to the graph
+        # Replace any existing graph
+        self._preds = {}
+        self._modes = {}
         for task in tasks:
-            task_id = task.get("id")
-            dependencies = task.get("dependencies", [])
-            execution_mode = task.get("executionMode", "sequential")
-            
-            self.add_task(task_id, dependencies, execution_mode)
+            self.add_task(task.get("id"), task.get("dependencies", []), task.get("executionMode", "sequential"))
         
-        # Validate the graph
-        errors = self.validate_dependencies()
-        if errors:
-            raise TaskDependencyError("\n".join(errors))
+        missing = self._missing_dependencies()
+        if missing:
+            raise TaskDependencyError("\n".join(missing))
         
-        # Create execution plan
+        # Create execution plan from the layers of ready tasks
         execution_plan = []
-        remaining_tasks = set(self.dependency_graph.nodes)
+        modes = self._modes
+        scheduled = set()
         
-        while remaining_tasks:
-            # Find tasks with no remaining dependencies
-            ready_tasks = []
-            for task_id in list(remaining_tasks):
-                predecessors = set(self.dependency_graph.predecessors(task_id))
-                if not predecessors.intersection(remaining_tasks):
-                    ready_tasks.append(task_id)
-            
-            if not ready_tasks:
-                # This shouldn't happen if the graph is acyclic
-                raise TaskDependencyError("Could not find next tasks to execute. This may indicate a cycle in the dependencies.")
-            
+        for ready_tasks in self._ready_layers():
             # Group the ready tasks by execution mode
             sequential_tasks = []
             parallel_tasks = []
             
             for task_id in ready_tasks:
-                execution_mode = self.dependency_graph.nodes[task_id].get("execution_mode", "sequential")
-                if execution_mode == "parallel":
+                if modes[task_id] == "parallel":
                     parallel_tasks.append(task_id)
                 else:
                     sequential_tasks.append(task_id)
@@ -151,13 +173,17 @@ class TaskDependencyManager:
             # Add sequential tasks individually
             for task_id in sequential_tasks:
                 execution_plan.append([task_id])
-                remaining_tasks.remove(task_id)
             
             # Add parallel tasks as a group
             if parallel_tasks:
                 execution_plan.append(parallel_tasks)
-                for task_id in parallel_tasks:
-                    remaining_tasks.remove(task_id)
+            
+            scheduled.update(ready_tasks)
+        
+        if len(scheduled) < len(self._preds):
+            # Whatever is left waits on itself through a cycle
+            remaining = [task_id for task_id in self._preds if task_id not in scheduled]
+            raise TaskDependencyError(f"Dependency cycle detected in tasks: {', '.join(remaining)}")
         
         return execution_plan
 
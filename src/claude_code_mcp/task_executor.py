@@ -38,26 +38,53 @@ Expected Output:
 
 import asyncio
 import concurrent.futures
+import heapq
 import subprocess
-import json
+import os
+import shlex
 import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 
+import orjson
 from loguru import logger
 
-# Try to import networkx for dependency management
-try:
-    import networkx as nx
-    HAVE_NETWORKX = True
-except ImportError:
-    HAVE_NETWORKX = False
+# Characters that only mean something to a shell; commands containing any of
+# them still go through /bin/sh unless the subtask says otherwise
+_SHELL_SYNTAX = frozenset("|&;<>()$`*?[]{}#~=\n")
+
+# Shell builtins with no executable of the same name; commands that start with
+# one of them also go through /bin/sh
+_SHELL_BUILTINS = frozenset({
+    ".", "alias", "bg", "break", "builtin", "cd", "command", "continue", "declare", "eval",
+    "exec", "exit", "export", "fg", "getopts", "hash", "jobs", "let", "local", "popd",
+    "pushd", "read", "readonly", "return", "set", "shift", "shopt", "source", "time",
+    "times", "trap", "type", "typeset", "ulimit", "umask", "unalias", "unset", "wait",
+})
+
+# Status file reads and writes get their own small pool instead of queueing
+# behind everything else on the loop's default executor. It is shared by every
+# TaskExecutor, so creating executors does not leave idle threads behind
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="task-io")
+
+
+def _needs_shell(command: str) -> bool:
+    """Return True if a command uses shell syntax or starts with a shell builtin."""
+    if not _SHELL_SYNTAX.isdisjoint(command):
+        return True
+    words = command.split(None, 1)
+    return bool(words) and words[0] in _SHELL_BUILTINS
 
 
 class TaskStatus(str, Enum):
-    """Status of a task or subtask."""
+    """
+    Status of a task or subtask.
+    
+    Status dicts store the plain ``.value`` strings, which compare equal to the
+    members but serialize without going through the Enum machinery.
+    """
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
@@ -80,26 +107,46 @@ class TaskExecutor:
     It also supports dependency-based execution, where tasks can depend on other tasks.
     """
     
-    def __init__(self, storage_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_dir: Optional[Path] = None,
+        max_parallel: Optional[int] = None,
+        minimum_running_duration_ms: int = 50
+    ):
         """
         Initialize the task executor.
         
         Args:
             storage_dir: Directory to store task execution data
+            max_parallel: Most subtask commands to run at once across all tasks,
+                defaults to min(32, CPU count + 4)
+            minimum_running_duration_ms: How long a subtask must run before its
+                running state is journaled; faster subtasks only journal their result
         """
         self.storage_dir = storage_dir or Path("./task_data")
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
         
-        # Try to import TaskDependencyManager
-        self.dependency_manager = None
-        try:
-            # Only import if needed to avoid circular imports
-            if HAVE_NETWORKX:
-                from claude_code_mcp.task_dependencies import TaskDependencyManager
-                self.dependency_manager = TaskDependencyManager()
-        except ImportError:
-            logger.warning("NetworkX or TaskDependencyManager not available. Dependency management disabled.")
+        # Subtask status entries of each running task by subtask ID, so status
+        # updates do not scan the subtask list
+        self._subtask_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        # Bounds the number of live subprocesses, so a wide task cannot run the
+        # process out of file descriptors or fork slots. Subtasks mostly wait on
+        # their commands, so the default follows ThreadPoolExecutor's I/O sizing
+        self.max_parallel = max(1, max_parallel or min(32, (os.cpu_count() or 1) + 4))
+        self._sem = asyncio.Semaphore(self.max_parallel)
+        
+        # Open status journals of running tasks. The full status file is only
+        # written when a task starts and ends; each subtask transition in
+        # between is appended to <task_id>.jsonl as one small line, stamped
+        # with time.time_ns() rather than a formatted datetime
+        self._journals: Dict[str, int] = {}
+        self._running_write_delay = minimum_running_duration_ms / 1000
+        
+        # Imported here to avoid a circular import with task_dependencies
+        from claude_code_mcp.task_dependencies import TaskDependencyManager
+        self.dependency_manager = TaskDependencyManager()
     
     async def execute_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -114,39 +161,48 @@ class TaskExecutor:
         task_id = task_data.get("id", f"task-{int(time.time())}")
         subtasks = task_data.get("subtasks", [])
         execution_mode = task_data.get("executionMode", ExecutionMode.SEQUENTIAL)
+        self._normalize_subtasks(subtasks, execution_mode)
         
         # Initialize task status
         task_status = {
             "taskId": task_id,
-            "status": TaskStatus.RUNNING,
-            "subtasks": [{"id": st.get("id", f"subtask-{i}"), "status": TaskStatus.PENDING} 
-                         for i, st in enumerate(subtasks)],
+            "status": TaskStatus.RUNNING.value,
+            "subtasks": [{"id": subtask["id"], "status": TaskStatus.PENDING.value} for subtask in subtasks],
             "executionMode": execution_mode,
             "startTime": datetime.now().isoformat(),
             "endTime": None
         }
         
-        # Store initial status
+        # A lone sequential command has nothing to plan and nobody to share its
+        # progress with on disk, so it skips the dependency check, the initial
+        # status file and the journal; its status is written once, at the end
+        single = (
+            len(subtasks) <= 1
+            and execution_mode == ExecutionMode.SEQUENTIAL
+            and not any(subtask["dependencies"] for subtask in subtasks)
+        )
+        
+        # Store initial status and start a fresh journal
         self.active_tasks[task_id] = task_status
-        await self._save_task_status(task_id, task_status)
+        self._subtask_index[task_id] = {subtask["id"]: subtask for subtask in task_status["subtasks"]}
+        if not single:
+            await self._save_task_status(task_id, task_status)
+            self._open_journal(task_id)
         
         try:
+            if single:
+                await self._execute_sequential(task_id, subtasks)
             # Check if we can use dependency-based execution
-            if self.dependency_manager is not None and HAVE_NETWORKX:
-                # Extract dependencies
-                for i, subtask in enumerate(subtasks):
-                    if "id" not in subtask:
-                        subtask["id"] = f"subtask-{i}"
-                    if "dependencies" not in subtask:
-                        subtask["dependencies"] = []
-                    # Ensure executionMode is set
-                    if "executionMode" not in subtask:
-                        subtask["executionMode"] = execution_mode
+            elif self.dependency_manager is not None:
+                # Check the dependencies before anything runs. A cycle or a
+                # missing dependency fails the task here rather than running
+                # every subtask in a fallback mode that ignores the dependencies
+                self.dependency_manager.create_execution_plan(subtasks)
                 
-                # Create execution plan based on dependencies
+                # Run subtasks as they become ready
                 try:
-                    execution_plan = self.dependency_manager.create_execution_plan(subtasks)
-                    await self._execute_with_dependencies(task_id, subtasks, execution_plan)
+                    subtask_map = {subtask["id"]: subtask for subtask in subtasks}
+                    await self._execute_with_dependencies(task_id, subtask_map)
                 except Exception as e:
                     logger.error(f"Dependency-based execution failed, falling back to {execution_mode} mode: {e}")
                     # Fall back to simple execution mode
@@ -162,36 +218,60 @@ class TaskExecutor:
                     await self._execute_sequential(task_id, subtasks)
                 
             # Mark task as completed
-            task_status["status"] = TaskStatus.COMPLETED
+            task_status["status"] = TaskStatus.COMPLETED.value
         except Exception as e:
             logger.error(f"Task {task_id} failed: {e}")
-            task_status["status"] = TaskStatus.FAILED
+            task_status["status"] = TaskStatus.FAILED.value
             task_status["error"] = str(e)
         finally:
-            # Set end time
+            # Set end time and write the final status, which supersedes the journal
             task_status["endTime"] = datetime.now().isoformat()
-            await self._save_task_status(task_id, task_status)
+            await self._save_task_status(task_id, task_status, pretty=True)
+            self._close_journal(task_id)
+            self._subtask_index.pop(task_id, None)
             
         return task_status
     
+    @staticmethod
+    def _normalize_subtasks(subtasks: List[Dict[str, Any]], execution_mode: str) -> None:
+        """
+        Fill in the defaults of each subtask in place, once per task.
+        
+        Every subtask gets an ``id`` (``subtask-<index>`` if missing), a
+        ``dependencies`` list and an ``executionMode`` (the task's mode if
+        missing), so the rest of the executor can index them directly.
+        """
+        for i, subtask in enumerate(subtasks):
+            if "id" not in subtask:
+                subtask["id"] = f"subtask-{i}"
+            if "dependencies" not in subtask:
+                subtask["dependencies"] = []
+            if "executionMode" not in subtask:
+                subtask["executionMode"] = execution_mode
+    
     async def _execute_sequential(self, task_id: str, subtasks: List[Dict[str, Any]]) -> None:
         """
         Execute subtasks sequentially.
         
         Args:
             task_id: ID of the parent task
-            subtasks: List of subtasks to execute
+            subtasks: Normalized subtasks to execute
         """
-        for i, subtask in enumerate(subtasks):
-            subtask_id = subtask.get("id", f"subtask-{i}")
-            logger.info(f"Executing subtask {subtask_id} sequentially")
-            
-            # Update subtask status to running
-            await self._update_subtask_status(task_id, subtask_id, TaskStatus.RUNNING)
+        logger.info("Executing {} subtasks of task {} sequentially", len(subtasks), task_id)
+        for subtask in subtasks:
+            subtask_id = subtask["id"]
+            logger.debug("Executing subtask {}", subtask_id)
             
             try:
-                # Execute the subtask
-                result = await self._execute_subtask(subtask)
+                async with self._sem:
+                    # Update subtask status to running
+                    running_write = self._mark_running(task_id, subtask_id)
+                    
+                    # Execute the subtask
+                    try:
+                        result = await self._execute_subtask(subtask)
+                    finally:
+                        running_write.cancel()
                 
                 # Update subtask status to completed
                 await self._update_subtask_status(
@@ -217,136 +297,238 @@ class TaskExecutor:
         
         Args:
             task_id: ID of the parent task
-            subtasks: List of subtasks to execute
+            subtasks: Normalized subtasks to execute
         """
-        # Create tasks for each subtask
-        tasks = []
-        for i, subtask in enumerate(subtasks):
-            subtask_id = subtask.get("id", f"subtask-{i}")
-            logger.info(f"Scheduling subtask {subtask_id} for parallel execution")
-            
-            # Update subtask status to running
-            await self._update_subtask_status(task_id, subtask_id, TaskStatus.RUNNING)
-            
-            # Create task
-            task = asyncio.create_task(self._execute_subtask_wrapper(task_id, subtask_id, subtask))
-            tasks.append(task)
+        batch = [(subtask["id"], subtask) for subtask in subtasks]
+        logger.info("Scheduling {} subtasks of task {} for parallel execution", len(batch), task_id)
+        logger.opt(lazy=True).debug("Parallel subtasks: {}", lambda: [subtask_id for subtask_id, _ in batch])
         
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks)
+        await self._execute_batch(task_id, batch)
     
-    async def _execute_with_dependencies(self, task_id: str, subtasks: List[Dict[str, Any]], execution_plan: List[List[str]]) -> None:
+    async def _execute_with_dependencies(self, task_id: str, subtask_map: Dict[str, Dict[str, Any]]) -> None:
         """
-        Execute subtasks according to the dependency-based execution plan.
+        Execute subtasks as soon as their dependencies have completed.
+        
+        Instead of running the plan wave by wave, a ready queue is fed as each
+        subtask finishes, so a slow subtask only holds back its own dependents.
+        Ready subtasks are started longest remaining chain first (critical-path
+        priority), so long chains get going before short side branches take the
+        free slots. At most max_parallel subtasks are in flight at a time. Parallel-mode
+        subtasks start as soon as they are ready and a slot is free; a sequential-mode
+        subtask waits until nothing else is running and runs alone. When a
+        subtask fails, everything that depends on it is cancelled while
+        independent branches keep going.
         
         Args:
             task_id: ID of the parent task
-            subtasks: List of subtasks to execute
-            execution_plan: List of subtask groups to execute in order
+            subtask_map: Subtasks with dependencies and execution modes, by ID
         """
-        # Create a map of subtask ID to subtask
-        subtask_map = {subtask.get("id", f"subtask-{i}"): subtask for i, subtask in enumerate(subtasks)}
+        # Build the dependency edges
+        indegree = {subtask_id: 0 for subtask_id in subtask_map}
+        successors: Dict[str, List[str]] = {subtask_id: [] for subtask_id in subtask_map}
+        for subtask_id, subtask in subtask_map.items():
+            for dep in subtask.get("dependencies", []):
+                if dep in successors:
+                    successors[dep].append(subtask_id)
+                    indegree[subtask_id] += 1
+        
+        # Rank each subtask by the length of the longest chain it starts,
+        # sweeping a topological order from the sinks back
+        order = [subtask_id for subtask_id, degree in indegree.items() if degree == 0]
+        remaining = dict(indegree)
+        for subtask_id in order:
+            for succ in successors[subtask_id]:
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    order.append(succ)
+        rank: Dict[str, int] = {}
+        for subtask_id in reversed(order):
+            rank[subtask_id] = 1 + max((rank[succ] for succ in successors[subtask_id]), default=0)
         
-        # Execute each group in the plan
-        for group in execution_plan:
-            logger.info(f"Executing subtask group: {group}")
+        # Heap of (-rank, declaration index, ID); ties keep the declared order
+        position = {subtask_id: i for i, subtask_id in enumerate(subtask_map)}
+        ready = [(-rank[subtask_id], position[subtask_id], subtask_id) for subtask_id in order
+                 if indegree[subtask_id] == 0]
+        heapq.heapify(ready)
+        running: Dict[asyncio.Task, str] = {}
+        exclusive = False  # A sequential subtask is running
+        
+        while ready or running:
+            # Start everything that may run now, highest rank first
+            started = []
+            while ready and not exclusive and len(running) + len(started) < self.max_parallel:
+                subtask_id = ready[0][2]
+                if subtask_map[subtask_id].get("executionMode") != ExecutionMode.PARALLEL:
+                    if running or started:
+                        break
+                    exclusive = True
+                heapq.heappop(ready)
+                started.append(subtask_id)
             
-            if len(group) == 1:
-                # Sequential execution for a single task
-                subtask_id = group[0]
-                subtask = subtask_map.get(subtask_id)
-                if subtask:
-                    await self._update_subtask_status(task_id, subtask_id, TaskStatus.RUNNING)
-                    try:
-                        result = await self._execute_subtask(subtask)
-                        await self._update_subtask_status(
-                            task_id, 
-                            subtask_id, 
-                            TaskStatus.COMPLETED, 
-                            output=result.get("output")
-                        )
-                    except Exception as e:
-                        logger.error(f"Subtask {subtask_id} failed: {e}")
-                        await self._update_subtask_status(
-                            task_id, 
-                            subtask_id, 
-                            TaskStatus.FAILED, 
-                            error=str(e)
-                        )
-                        # Depending on configuration, we might want to fail the entire task here
-                        raise  # Re-raise to stop execution
-            else:
-                # Parallel execution for a group of tasks
-                tasks = []
-                for subtask_id in group:
-                    subtask = subtask_map.get(subtask_id)
-                    if subtask:
-                        await self._update_subtask_status(task_id, subtask_id, TaskStatus.RUNNING)
-                        task = asyncio.create_task(self._execute_subtask_wrapper(task_id, subtask_id, subtask))
-                        tasks.append(task)
+            if started:
+                logger.info("Executing subtask group of task {}: {}", task_id, started)
+                for subtask_id in started:
+                    coro = self._execute_subtask_wrapper(task_id, subtask_id, subtask_map[subtask_id])
+                    running[asyncio.create_task(coro)] = subtask_id
+            
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                subtask_id = running.pop(finished)
+                if subtask_map[subtask_id].get("executionMode") != ExecutionMode.PARALLEL:
+                    exclusive = False
                 
-                # Wait for all tasks in this group to complete
-                await asyncio.gather(*tasks)
+                if finished.result():
+                    # Release dependents whose last dependency just completed
+                    for succ in successors[subtask_id]:
+                        indegree[succ] -= 1
+                        if indegree[succ] == 0:
+                            heapq.heappush(ready, (-rank[succ], position[succ], succ))
+                else:
+                    await self._cancel_dependents(task_id, subtask_id, successors)
+    
+    async def _cancel_dependents(self, task_id: str, failed_id: str, successors: Dict[str, List[str]]) -> None:
+        """
+        Mark every subtask downstream of a failed subtask as cancelled.
+        
+        Args:
+            task_id: ID of the parent task
+            failed_id: ID of the subtask that failed
+            successors: Direct dependents of each subtask
+        """
+        cancelled = set()
+        stack = list(successors[failed_id])
+        while stack:
+            subtask_id = stack.pop()
+            if subtask_id not in cancelled:
+                cancelled.add(subtask_id)
+                stack.extend(successors[subtask_id])
+        
+        if cancelled:
+            logger.warning(f"Cancelling subtasks {sorted(cancelled)} after {failed_id} failed")
+            for subtask_id in cancelled:
+                self._record_subtask_status(task_id, subtask_id, TaskStatus.CANCELLED)
+    
+    async def _execute_batch(self, task_id: str, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Start a batch of subtasks together and wait for all of them.
+        
+        All of them are gathered at once instead of being scheduled one by one;
+        each is marked running when it gets one of the max_parallel slots.
+        
+        Args:
+            task_id: ID of the parent task
+            batch: (subtask ID, subtask) pairs to run concurrently
+        """
+        if not batch:
+            return
+        
+        await asyncio.gather(
+            *(self._execute_subtask_wrapper(task_id, subtask_id, subtask) for subtask_id, subtask in batch)
+        )
     
     async def _execute_subtask_wrapper(
         self, 
         task_id: str, 
         subtask_id: str, 
         subtask: Dict[str, Any]
-    ) -> None:
+    ) -> bool:
         """
-        Wrapper for executing a subtask in parallel mode.
+        Wrapper for executing a subtask concurrently with others.
+        
+        The subtask waits for a free slot before it is marked running.
         
         Args:
             task_id: ID of the parent task
             subtask_id: ID of the subtask
             subtask: Subtask data
+            
+        Returns:
+            True if the subtask completed, False if it failed
         """
-        try:
-            result = await self._execute_subtask(subtask)
-            await self._update_subtask_status(
-                task_id, 
-                subtask_id, 
-                TaskStatus.COMPLETED, 
-                output=result.get("output")
-            )
-        except Exception as e:
-            logger.error(f"Subtask {subtask_id} failed: {e}")
-            await self._update_subtask_status(
-                task_id, 
-                subtask_id, 
-                TaskStatus.FAILED, 
-                error=str(e)
-            )
+        async with self._sem:
+            running_write = self._mark_running(task_id, subtask_id)
+            try:
+                result = await self._execute_subtask(subtask)
+                await self._update_subtask_status(
+                    task_id, 
+                    subtask_id, 
+                    TaskStatus.COMPLETED, 
+                    output=result.get("output")
+                )
+                return True
+            except Exception as e:
+                logger.error(f"Subtask {subtask_id} failed: {e}")
+                await self._update_subtask_status(
+                    task_id, 
+                    subtask_id, 
+                    TaskStatus.FAILED, 
+                    error=str(e)
+                )
+                return False
+            finally:
+                running_write.cancel()
     
     async def _execute_subtask(self, subtask: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a single subtask.
         
+        The command is started directly from an argument list, without a
+        /bin/sh in between, when the subtask gives an ``argv`` or its command
+        is a plain word list that does not start with a shell builtin such as
+        ``cd`` or ``export``. If a bare command name is not found as an
+        executable, the command is retried through /bin/sh. Set ``shell`` to True to force the shell, or to
+        False to always split the command with shlex. Set ``captureOutput`` to
+        False for commands whose output nobody reads; their stdout and stderr
+        go to /dev/null and no output is recorded.
+        
         Args:
-            subtask: Subtask data including command to execute
+            subtask: Subtask data including command or argv to execute
             
         Returns:
             Execution result
         """
+        argv = subtask.get("argv")
         command = subtask.get("command")
-        if not command:
+        if not argv and not command:
             raise ValueError("Subtask command is required")
         
-        # Use asyncio to run the command
-        proc = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        capture = subtask.get("captureOutput", True)
+        stream = asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL
+        
+        shell = subtask.get("shell")
+        if not argv and (shell is True or (shell is None and _needs_shell(command))):
+            proc = await asyncio.create_subprocess_shell(command, stdout=stream, stderr=stream)
+        else:
+            argv = argv or shlex.split(command)
+            try:
+                proc = await asyncio.create_subprocess_exec(*argv, stdout=stream, stderr=stream)
+            except FileNotFoundError as e:
+                # A bare name that is not an executable may still be something
+                # only the shell knows, such as a builtin missing from
+                # _SHELL_BUILTINS, so let /bin/sh have a go before giving up
+                if shell is not None or "/" in argv[0]:
+                    raise RuntimeError(f"Command could not be started: {e}") from e
+                proc = await asyncio.create_subprocess_shell(
+                    command or shlex.join(argv), stdout=stream, stderr=stream
+                )
+            except OSError as e:
+                raise RuntimeError(f"Command could not be started: {e}") from e
+        
+        if not capture:
+            returncode = await proc.wait()
+            if returncode != 0:
+                raise RuntimeError(f"Command failed with exit code {returncode}")
+            return {"output": None, "exitCode": returncode}
         
         stdout, stderr = await proc.communicate()
         
         if proc.returncode != 0:
-            raise RuntimeError(f"Command failed with exit code {proc.returncode}: {stderr.decode()}")
+            raise RuntimeError(
+                f"Command failed with exit code {proc.returncode}: {stderr.decode(errors='replace')}"
+            )
         
         return {
-            "output": stdout.decode(),
+            "output": stdout.decode(errors="replace"),
             "exitCode": proc.returncode
         }
     
@@ -368,41 +550,147 @@ class TaskExecutor:
             output: Optional output
             error: Optional error message
         """
-        if task_id not in self.active_tasks:
-            logger.warning(f"Task {task_id} not found in active tasks")
+        self._record_subtask_status(task_id, subtask_id, status, output, error)
+    
+    def _record_subtask_status(
+        self, 
+        task_id: str, 
+        subtask_id: str, 
+        status: TaskStatus, 
+        output: Optional[str] = None, 
+        error: Optional[str] = None
+    ) -> None:
+        """Update a subtask in memory and append the change to the task's journal."""
+        if self._set_subtask_status(task_id, subtask_id, status, output, error):
+            self._append_journal(task_id, subtask_id, status, output, error)
+    
+    def _mark_running(self, task_id: str, subtask_id: str) -> asyncio.TimerHandle:
+        """
+        Mark a subtask running, journaling it only if it is still running later.
+        
+        Most subtasks that finish within minimum_running_duration_ms would have
+        their running entry superseded almost at once, so it is written by a
+        timer that the caller cancels when the subtask ends.
+        
+        Returns:
+            The timer to cancel once the subtask has finished
+        """
+        self._set_subtask_status(task_id, subtask_id, TaskStatus.RUNNING)
+        return asyncio.get_running_loop().call_later(
+            self._running_write_delay, self._append_journal, task_id, subtask_id, TaskStatus.RUNNING
+        )
+    
+    def _append_journal(
+        self, 
+        task_id: str, 
+        subtask_id: str, 
+        status: TaskStatus, 
+        output: Optional[str] = None, 
+        error: Optional[str] = None
+    ) -> None:
+        """Append a subtask change to the task's journal, if it has one open."""
+        fd = self._journals.get(task_id)
+        if fd is None:
             return
+        entry = {
+            "subtask_id": subtask_id,
+            "status": status.value if isinstance(status, TaskStatus) else status,
+            "ts": time.time_ns()
+        }
+        if output is not None:
+            entry["output"] = output
+        if error is not None:
+            entry["error"] = error
+        # A single O_APPEND write, so concurrent readers never see a torn line
+        os.write(fd, orjson.dumps(entry) + b"\n")
+    
+    def _set_subtask_status(
+        self, 
+        task_id: str, 
+        subtask_id: str, 
+        status: TaskStatus, 
+        output: Optional[str] = None, 
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        Update the in-memory status of a subtask without saving it.
         
-        # Find the subtask
-        for subtask in self.active_tasks[task_id]["subtasks"]:
-            if subtask["id"] == subtask_id:
-                subtask["status"] = status
-                if output is not None:
-                    subtask["output"] = output
-                if error is not None:
-                    subtask["error"] = error
-                break
+        Returns:
+            False if the task is not active, True otherwise
+        """
+        index = self._subtask_index.get(task_id)
+        if index is None:
+            logger.warning(f"Task {task_id} not found in active tasks")
+            return False
         
-        # Save updated status
-        await self._save_task_status(task_id, self.active_tasks[task_id])
+        subtask = index.get(subtask_id)
+        if subtask is not None:
+            subtask["status"] = status.value if isinstance(status, TaskStatus) else status
+            if output is not None:
+                subtask["output"] = output
+            if error is not None:
+                subtask["error"] = error
+        return True
     
-    async def _save_task_status(self, task_id: str, status: Dict[str, Any]) -> None:
+    def _journal_file(self, task_id: str) -> Path:
+        """Return the path of a task's status journal."""
+        return self.storage_dir / f"{task_id}.jsonl"
+    
+    def _open_journal(self, task_id: str) -> None:
+        """Start an empty journal for a task, replacing any left by an earlier run."""
+        self._close_journal(task_id)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND
+        self._journals[task_id] = os.open(self._journal_file(task_id), flags, 0o644)
+    
+    def _close_journal(self, task_id: str) -> None:
+        """Close and remove a task's journal once its full status has been saved."""
+        fd = self._journals.pop(task_id, None)
+        if fd is None:
+            return
+        os.close(fd)
+        try:
+            self._journal_file(task_id).unlink()
+        except FileNotFoundError:
+            pass
+    
+    async def _save_task_status(self, task_id: str, status: Dict[str, Any], pretty: bool = False) -> None:
         """
         Save task status to disk.
         
         Args:
             task_id: ID of the task
             status: Task status data
+            pretty: Indent the JSON, used for the final status that people read
         """
-        status_file = self.storage_dir / f"{task_id}.json"
-        
-        # Use executor to avoid blocking the event loop
+        # Serialize on the loop thread, where nothing can modify status mid-dump;
+        # only the file write goes to the executor to avoid blocking the loop
+        data = orjson.dumps(status, option=orjson.OPT_INDENT_2 if pretty else 0)
         loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            _IO_POOL, self._write_status_file, self._status_file(task_id), data
+        )
+    
+    @staticmethod
+    def _write_status_file(status_file: Path, data: bytes) -> None:
+        """
+        Replace a status file in one step.
         
-        def write_file():
-            with open(status_file, 'w') as f:
-                json.dump(status, f, indent=2)
-        
-        await loop.run_in_executor(None, write_file)
+        The data goes to a temporary file that is renamed over the status file,
+        so readers see either the old or the new status, never a partial one.
+        """
+        temp_path = f"{status_file}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, status_file)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    
+    def _status_file(self, task_id: str) -> Path:
+        """Return the path of a task's status file."""
+        return self.storage_dir / f"{task_id}.json"
     
     async def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -419,20 +707,78 @@ class TaskExecutor:
             return self.active_tasks[task_id]
         
         # Then check saved tasks
-        status_file = self.storage_dir / f"{task_id}.json"
-        if status_file.exists():
-            try:
-                loop = asyncio.get_running_loop()
-                
-                def read_file():
-                    with open(status_file, 'r') as f:
-                        return json.load(f)
-                
-                return await loop.run_in_executor(None, read_file)
-            except Exception as e:
-                logger.error(f"Error reading task status: {e}")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_IO_POOL, self.read_task_status, task_id)
+    
+    def get_task_status_nowait(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a task without going through an event loop.
+        
+        Safe to call from any thread: active tasks are a plain dict lookup and
+        saved tasks are read from disk on the calling thread.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            Task status data if found, None otherwise
+        """
+        status = self.active_tasks.get(task_id)
+        if status is not None:
+            return status
+        return self.read_task_status(task_id)
+    
+    def read_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a task's saved status file.
+        
+        If the task has not finished, the subtask changes recorded in its
+        journal since the status file was written are replayed on top of it.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            Task status data if the file exists and is readable, None otherwise
+        """
+        status_file = self._status_file(task_id)
+        if not status_file.exists():
+            return None
+        
+        try:
+            status = orjson.loads(status_file.read_bytes())
+        except Exception as e:
+            logger.error(f"Error reading task status: {e}")
+            return None
+        
+        if status.get("endTime") is None:
+            self._replay_journal(task_id, status)
+        return status
+    
+    def _replay_journal(self, task_id: str, status: Dict[str, Any]) -> None:
+        """Apply a task's journaled subtask changes to a status read from disk."""
+        try:
+            lines = self._journal_file(task_id).read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Error reading task journal: {e}")
+            return
         
-        return None
+        subtasks = {subtask["id"]: subtask for subtask in status.get("subtasks", [])}
+        for line in lines:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A line still being written by a crashed or running executor
+                continue
+            subtask = subtasks.get(entry.get("subtask_id"))
+            if subtask is None:
+                continue
+            subtask["status"] = entry["status"]
+            for key in ("output", "error"):
+                if key in entry:
+                    subtask[key] = entry[key]
 
 
 # Validation function
@@ -470,6 +816,28 @@ def _validate_task_executor() -> bool:
     except Exception as e:
         all_validation_failures.append(f"Status enum test failed: {str(e)}")
     
+    # Test 4: Journaled subtask changes are replayed onto an unfinished task
+    total_tests += 1
+    try:
+        executor = TaskExecutor(storage_dir=Path("./test_task_data"))
+        status = {
+            "taskId": "journal-test",
+            "status": TaskStatus.RUNNING,
+            "subtasks": [{"id": "a", "status": TaskStatus.PENDING}],
+            "endTime": None
+        }
+        executor.active_tasks["journal-test"] = status
+        executor._subtask_index["journal-test"] = {"a": status["subtasks"][0]}
+        (executor.storage_dir / "journal-test.json").write_bytes(orjson.dumps(status))
+        executor._open_journal("journal-test")
+        executor._record_subtask_status("journal-test", "a", TaskStatus.COMPLETED, output="done")
+        saved = executor.read_task_status("journal-test")
+        executor._close_journal("journal-test")
+        assert saved["subtasks"][0]["status"] == "completed", "Journal status not replayed"
+        assert saved["subtasks"][0]["output"] == "done", "Journal output not replayed"
+    except Exception as e:
+        all_validation_failures.append(f"Journal replay test failed: {str(e)}")
+    
     # Final validation result
     if all_validation_failures:
         print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
@@ -11,36 +11,135 @@ Usage:
   python task_orchestration.py task-status <task_id>
 """
 
-import sys
-import os
+import contextlib
+import io
 import json
+import os
 import subprocess
+import sys
+import threading
+from collections import deque
 from pathlib import Path
+from typing import Deque, List, TextIO, Tuple
 
 # Set up environment
 PROJECT_ROOT = Path(__file__).resolve().parent
 PYTHON_PATH = PROJECT_ROOT / ".venv" / "bin" / "python"
 os.environ["PYTHONPATH"] = str(PROJECT_ROOT)
 
+# How much of a failed command's stderr is reported back: lines for a child
+# process, writes for a command run in-process
+ERROR_TAIL_SIZE = 50
+
+
+def _run_streaming(cmd: List[str]) -> Tuple[int, str]:
+    """
+    Run a command, passing its stdout through line by line as it is produced.
+    
+    Only the last ERROR_TAIL_SIZE lines of stderr are kept, so memory use no
+    longer grows with the amount of output the child prints.
+    
+    Returns:
+        (exit code, stderr tail)
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
+    )
+    assert proc.stdout and proc.stderr
+    
+    # stdout is copied on this thread; stderr is collected on another, since
+    # waiting on either pipe alone could stall the child once the other fills
+    stderr_tail: Deque[str] = deque(maxlen=ERROR_TAIL_SIZE)
+    drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    
+    for line in proc.stdout:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+    
+    returncode = proc.wait()
+    drain.join()
+    return returncode, "".join(stderr_tail)
+
+
+class _StderrTail(io.TextIOBase):
+    """Pass stderr writes through while keeping the most recent ones."""
+    
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self.chunks: Deque[str] = deque(maxlen=ERROR_TAIL_SIZE)
+    
+    def write(self, text: str) -> int:
+        self.stream.write(text)
+        self.chunks.append(text)
+        return len(text)
+    
+    def flush(self) -> None:
+        self.stream.flush()
+    
+    def text(self) -> str:
+        return "".join(self.chunks).strip()
+
+
+def _run_cli(args: List[str]) -> Tuple[int, str]:
+    """
+    Run a claude_code_mcp.cli command.
+    
+    When the package is importable from this interpreter the command runs
+    in-process, saving the interpreter startup and imports of a child
+    python; otherwise it falls back to the virtualenv's python. In-process
+    failures, including commands that call sys.exit(), are turned into an
+    exit code, with the command's recent stderr output and error log
+    messages as the error message.
+    
+    Returns:
+        (exit code, error message)
+    """
+    cmd = [str(PYTHON_PATH), "-m", "claude_code_mcp.cli", *args]
+    try:
+        from loguru import logger
+
+        from claude_code_mcp.cli import app
+    except ImportError:
+        print(f"Running command: {' '.join(cmd)}")
+        return _run_streaming(cmd)
+    
+    print(f"Running command: claude_code_mcp.cli {' '.join(args)} (in-process)")
+    stderr_tail = _StderrTail(sys.stderr)
+    # Error log messages go to the stderr stream loguru was set up with, so
+    # they are collected by a sink of their own
+    sink_id = logger.add(stderr_tail.chunks.append, level="ERROR", format="{message}")
+    try:
+        with contextlib.redirect_stderr(stderr_tail):
+            # standalone_mode=False returns the exit code instead of exiting
+            returncode = app(
+                args=list(args), prog_name="claude_code_mcp.cli", standalone_mode=False
+            )
+    except SystemExit as e:
+        returncode = e.code
+    except Exception as e:
+        returncode = 1
+        stderr_tail.chunks.append(str(e) or type(e).__name__)
+    finally:
+        logger.remove(sink_id)
+    
+    if isinstance(returncode, str):
+        # sys.exit("message") exits with status 1 after printing the message
+        stderr_tail.chunks.append(returncode)
+        returncode = 1
+    if not returncode:
+        return 0, ""
+    return returncode, stderr_tail.text() or f"Command exited with code {returncode}"
+
 
 def convert_task(markdown_path, output_path):
     """Convert a markdown task description to JSON format."""
-    cmd = [
-        str(PYTHON_PATH),
-        "-m",
-        "claude_code_mcp.cli",
-        "convert-task-markdown",
-        markdown_path,
-        "--output-path",
-        output_path,
-    ]
-    
-    print(f"Running command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    
-    if result.returncode == 0:
+    returncode, stderr = _run_cli(
+        ["convert-task-markdown", markdown_path, "--output-path", output_path]
+    )
+    
+    if returncode == 0:
         print("Task conversion successful")
-        print(result.stdout)
         
         # Read and validate the output file
         try:
@@ -54,49 +153,27 @@ def convert_task(markdown_path, output_path):
             print(f"Error reading output file: {e}")
     else:
         print("Task conversion failed")
-        print(f"Error: {result.stderr}")
+        print(f"Error: {stderr}")
 
 
 def execute_task(task_id):
     """Execute a task with the task orchestration system."""
-    cmd = [
-        str(PYTHON_PATH),
-        "-m",
-        "claude_code_mcp.cli",
-        "execute-task",
-        task_id,
-    ]
-    
-    print(f"Running command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    
-    if result.returncode == 0:
-        print("Task execution started")
-        print(result.stdout)
+    returncode, stderr = _run_cli(["execute-task", task_id])
+    
+    if returncode == 0:
+        print("Task execution finished")
     else:
         print("Task execution failed")
-        print(f"Error: {result.stderr}")
+        print(f"Error: {stderr}")
 
 
 def task_status(task_id):
     """Check the status of a task."""
-    cmd = [
-        str(PYTHON_PATH),
-        "-m",
-        "claude_code_mcp.cli",
-        "task-status",
-        task_id,
-    ]
-    
-    print(f"Running command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    
-    if result.returncode == 0:
-        print("Task status:")
-        print(result.stdout)
-    else:
+    returncode, stderr = _run_cli(["task-status", task_id])
+    
+    if returncode != 0:
         print("Failed to retrieve task status")
-        print(f"Error: {result.stderr}")
+        print(f"Error: {stderr}")
 
 
 def main():
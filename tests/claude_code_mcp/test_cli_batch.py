@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test suite for batched subtask execution in the CLI module.
+
+This test suite validates that a batched Claude response is split back into
+per-subtask results, and that subtasks the response does not cover are
+executed individually and concurrently.
+
+Documentation:
+- pytest: https://docs.pytest.org/
+- CLI: See src/claude_code_mcp/cli.py
+
+Sample Input:
+  A batched response holding a fenced JSON array with one object per subtask
+
+Expected Output:
+  One result per subtask, in input order
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from claude_code_mcp import cli
+
+ENTRIES = [
+    {"id": "task-1", "report_markdown": "First report", "duration_sec": 1.5},
+    {"id": "task-2", "report_markdown": "Second report", "duration_sec": 2.5},
+]
+
+
+def _subtasks(count):
+    return [
+        {"id": f"task-{i}", "title": f"Subtask {i}", "description": "", "steps": ["Do it"]}
+        for i in range(1, count + 1)
+    ]
+
+
+def test_parse_fenced_block():
+    """Test that the fenced JSON block is parsed despite markdown around it."""
+    response = (
+        "- [x] Ran every item, see [the docs](https://example.com)\n\n"
+        f"```json\n{json.dumps(ENTRIES)}\n```\n\n- [ ] Nothing left"
+    )
+    assert cli._parse_batch_response(response) == ENTRIES
+
+
+def test_parse_unfenced_array_after_checkbox():
+    """Test that an unfenced array is found past a markdown checkbox."""
+    response = f"- [ ] Checked the items\n{json.dumps(ENTRIES)}\nDone [1]."
+    assert cli._parse_batch_response(response) == ENTRIES
+
+
+def test_parse_without_array():
+    """Test that a response without an array of objects is rejected."""
+    with pytest.raises(ValueError):
+        cli._parse_batch_response("- [ ] Nothing to report [1]")
+
+
+def test_batch_uses_parsed_entries(monkeypatch, tmp_path):
+    """Test that every subtask in the reply gets its own report from one call."""
+    prompts = []
+
+    async def fake_claude(prompt, timeout=300, system_prompt=None):
+        prompts.append(prompt)
+        return f"```json\n{json.dumps(ENTRIES)}\n```"
+
+    monkeypatch.setattr(cli, "run_claude_cli_async", fake_claude)
+    results = asyncio.run(cli.execute_subtask_batch(_subtasks(2), "parallel", tmp_path))
+
+    assert len(prompts) == 1
+    assert [r["id"] for r in results] == ["task-1", "task-2"]
+    assert [r["execution_time"] for r in results] == [1.5, 2.5]
+    assert "Second report" in (tmp_path / "004_task_2_subtask_2.md").read_text()
+
+
+def test_batch_fallbacks_run_concurrently(monkeypatch, tmp_path):
+    """Test that subtasks missing from the reply are executed at the same time."""
+    running = 0
+    peak = 0
+
+    async def fake_claude(prompt, timeout=300, system_prompt=None):
+        nonlocal running, peak
+        if "Batch item" in prompt:
+            return "Sorry, no JSON this time."
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return "Individual report"
+
+    monkeypatch.setattr(cli, "run_claude_cli_async", fake_claude)
+    results = asyncio.run(cli.execute_subtask_batch(_subtasks(3), "parallel", tmp_path))
+
+    assert [r["id"] for r in results] == ["task-1", "task-2", "task-3"]
+    assert all(r["output_summary"] == "Individual report" for r in results)
+    assert peak == 3
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test suite for the line-delimited JSON-RPC server in the CLI module.
+
+This test suite runs `serve` in a subprocess and checks that a request line
+longer than MAX_REQUEST_BYTES is answered with an error while the server
+keeps handling the requests after it, whether stdin is a pipe or a file.
+
+Documentation:
+- pytest: https://docs.pytest.org/
+- JSON-RPC 2.0: https://www.jsonrpc.org/specification
+- CLI: See src/claude_code_mcp/cli.py
+
+Sample Input:
+  A 17 MiB list_tools line followed by a normal list_tools request
+
+Expected Output:
+  A -32600 error, then the list_tools result for the second request
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from claude_code_mcp.cli import MAX_REQUEST_BYTES
+
+OVERSIZED = b'{"jsonrpc":"2.0","id":1,"method":"list_tools","params":{"pad":"'
+OVERSIZED += b"x" * (MAX_REQUEST_BYTES + 1024 * 1024) + b'"}}\n'
+VALID = b'{"jsonrpc":"2.0","id":2,"method":"list_tools","params":{}}\n'
+
+
+def _serve(tmp_path, stdin_is_file):
+    """Run the server on the oversized and the valid request and return its responses."""
+    command = [sys.executable, "-m", "claude_code_mcp.cli", "serve"]
+    if stdin_is_file:
+        requests = tmp_path / "requests.jsonl"
+        requests.write_bytes(OVERSIZED + VALID)
+        with open(requests, "rb") as stdin:
+            proc = subprocess.run(
+                command, stdin=stdin, capture_output=True, cwd=tmp_path, timeout=60
+            )
+    else:
+        proc = subprocess.run(
+            command, input=OVERSIZED + VALID, capture_output=True, cwd=tmp_path, timeout=60
+        )
+    assert proc.returncode == 0, proc.stderr.decode(errors="replace")[-2000:]
+    return [json.loads(line) for line in proc.stdout.splitlines()]
+
+
+@pytest.mark.parametrize("stdin_is_file", [False, True], ids=["pipe", "file"])
+def test_oversized_request_is_rejected_and_serving_continues(tmp_path, stdin_is_file):
+    """Test that a too-large line gets -32600 and the next request is still answered."""
+    responses = _serve(tmp_path, stdin_is_file)
+
+    assert len(responses) == 2
+    assert responses[0]["id"] is None
+    assert responses[0]["error"]["code"] == -32600
+    assert responses[1]["id"] == 2
+    assert "tools" in responses[1]["result"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
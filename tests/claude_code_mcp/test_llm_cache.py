@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Claude response cache.
+
+This test suite validates cache keys, entry expiry and the atomic write of
+cache entries.
+
+Documentation:
+- pytest: https://docs.pytest.org/
+- Response cache: See src/claude_code_mcp/llm_cache.py
+
+Sample Input:
+  llm_cache.put("Say hello", "Hello!")
+
+Expected Output:
+  llm_cache.get("Say hello") returns "Hello!"
+"""
+
+import json
+
+import pytest
+
+from claude_code_mcp import llm_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Enable the cache in a temporary directory for each test."""
+    monkeypatch.setenv("CLAUDE_MCP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("CLAUDE_MCP_CACHE_ENABLED", "1")
+    monkeypatch.delenv("CLAUDE_MCP_CACHE_TTL_DAYS", raising=False)
+    monkeypatch.setattr(llm_cache, "_disabled", False)
+    return tmp_path
+
+
+def test_round_trip():
+    """Test that a stored response is returned for the same prompt only."""
+    llm_cache.put("Say hello", "Hello!")
+    assert llm_cache.get("Say hello") == "Hello!"
+    assert llm_cache.get("Say goodbye") is None
+
+
+def test_key_includes_system_prompt():
+    """Test that the same prompt under another system prompt is a different entry."""
+    llm_cache.put("Say hello", "Hello!", system_prompt="Be brief")
+    assert llm_cache.get("Say hello", system_prompt="Be brief") == "Hello!"
+    assert llm_cache.get("Say hello") is None
+    assert llm_cache.get("Say hello", system_prompt="Be verbose") is None
+
+
+def test_expired_entry_is_a_miss(monkeypatch):
+    """Test that an entry older than its TTL is ignored."""
+    now = 1_000_000.0
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now)
+    llm_cache.put("Expire me", "Old")
+
+    now += 7 * 86400 - 1
+    assert llm_cache.get("Expire me") == "Old"
+    now += 2
+    assert llm_cache.get("Expire me") is None
+
+
+def test_disabled_cache(monkeypatch):
+    """Test that nothing is stored or returned when the cache is off."""
+    monkeypatch.setenv("CLAUDE_MCP_CACHE_ENABLED", "0")
+    llm_cache.put("Say hello", "Hello!")
+    monkeypatch.setenv("CLAUDE_MCP_CACHE_ENABLED", "1")
+    assert llm_cache.get("Say hello") is None
+
+
+def test_write_leaves_only_the_entry(cache_dir):
+    """Test that a write leaves the finished entry and no temporary file."""
+    llm_cache.put("Say hello", "Hello!")
+    files = list(cache_dir.iterdir())
+    assert [f.suffix for f in files] == [".json"]
+    assert json.loads(files[0].read_text())["response"] == "Hello!"
+
+
+def test_failed_write_removes_temporary_file(cache_dir):
+    """Test that a response that cannot be serialized leaves nothing behind."""
+    llm_cache.put("Say hello", object())
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "content", ["[1, 2]", '"text"', '{"response": 3}', '{"ts": "x", "response": "a"}']
+)
+def test_malformed_entry_is_a_miss(cache_dir, content):
+    """Test that an entry that is not a well-formed object is treated as a miss."""
+    llm_cache._entry_path("Say hello").write_text(content)
+    assert llm_cache.get("Say hello") is None
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -5,8 +5,13 @@ Test suite for the Task Amender module.
 This test suite validates the task amender functionality to ensure
 it properly amends markdown task files to conform to the template guide.
 
+The tests share no state beyond module-scoped fixtures, which pytest-xdist
+builds once per worker, and files under tmp_path, so the module can run with
+`pytest -n auto`.
+
 Documentation:
 - pytest: https://docs.pytest.org/
+- pytest-xdist: https://pytest-xdist.readthedocs.io/
 - Task Amender: See src/claude_code_mcp/task_amender.py
 
 Sample Input:
@@ -16,31 +21,51 @@ Expected Output:
   Amended markdown file with all required sections
 """
 
-import os
-import tempfile
-import shutil
-from pathlib import Path
+import re
 
 import pytest
 
 from claude_code_mcp.task_amender import (
+    add_execution_info,
+    add_missing_sections,
+    amend_task_content,
     amend_task_list,
     check_required_sections,
-    add_missing_sections,
-    ensure_status_markers,
     ensure_checkboxes,
-    add_execution_info
+    ensure_status_markers,
 )
 
+# Sections the template guide requires, and one pattern that finds them all
+# in a single pass over the content. Every test refers to these instead of
+# repeating the literals
+REQUIRED_MARKERS: tuple[str, ...] = (
+    "**Objective**",
+    "**Requirements**",
+    "## Overview",
+    "## Usage Table",
+    "## Version Control Plan",
+    "## Resources",
+    "## Progress Tracking",
+    "## Report Documentation Requirements",
+)
+_MARKER_SET = frozenset(REQUIRED_MARKERS)
+_REQ_RE = re.compile("|".join(re.escape(marker) for marker in REQUIRED_MARKERS))
 
-@pytest.fixture
-def test_task_file():
-    """Create a temporary test task file with missing sections."""
-    temp_dir = tempfile.mkdtemp()
-    task_path = Path(temp_dir) / "test_task.md"
+
+def _missing_markers(found_in):
+    """
+    Return the required markers that do not occur in found_in.
     
-    # Create a minimal task file with missing sections
-    content = """# Task 999: Test Task
+    found_in is either text, scanned once with an alternation of the markers,
+    or a list of names such as the one check_required_sections returns.
+    """
+    if isinstance(found_in, str):
+        found_in = _REQ_RE.findall(found_in)
+    return _MARKER_SET.difference(found_in)
+
+
+# A minimal task with missing sections
+SAMPLE_MARKDOWN = """# Task 999: Test Task
 
 This is a test task with missing sections.
 
@@ -52,191 +77,106 @@ This is a test task with missing sections.
 - Step 2: Do something else
 
 """
-    
-    with open(task_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    yield task_path
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
 
 
-def test_check_required_sections(test_task_file):
-    """Test checking for required sections."""
-    with open(test_task_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    missing = check_required_sections(content)
-    
-    # Verify that expected sections are reported as missing
-    assert "**Objective**" in missing
-    assert "**Requirements**" in missing
-    assert "## Overview" in missing
-    assert "## Usage Table" in missing
-    assert "## Version Control Plan" in missing
-    assert "## Resources" in missing
-    assert "## Progress Tracking" in missing
-    assert "## Report Documentation Requirements" in missing
-
-
-def test_add_missing_sections(test_task_file):
-    """Test adding missing sections."""
-    with open(test_task_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Get missing sections
-    missing = check_required_sections(content)
-    
-    # Add missing sections
-    updated = add_missing_sections(content, missing)
-    
-    # Verify sections were added
-    assert "**Objective**" in updated
-    assert "**Requirements**" in updated
-    assert "## Overview" in updated
-    assert "## Usage Table" in updated
-    assert "## Version Control Plan" in updated
-    assert "## Resources" in updated
-    assert "## Progress Tracking" in updated
-    assert "## Report Documentation Requirements" in updated
-
-
-def test_ensure_status_markers(test_task_file):
-    """Test ensuring status markers are added."""
-    with open(test_task_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    updated = ensure_status_markers(content)
-    
-    # Verify status markers were added
-    assert "# Task 999: Test Task ⏳ Not Started" in updated
-    assert "### Task 1: Test Subtask ⏳ Not Started" in updated
+@pytest.fixture(scope="module")
+def sample_markdown():
+    """Provide the sample task as a string; the amender steps need no file."""
+    return SAMPLE_MARKDOWN
 
 
-def test_ensure_checkboxes(test_task_file):
-    """Test ensuring checkboxes are added to steps."""
-    with open(test_task_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    updated = ensure_checkboxes(content)
-    
-    # Verify checkboxes were added
-    assert "- [ ] Step 1: Do something" in updated
-    assert "- [ ] Step 2: Do something else" in updated
+@pytest.fixture
+def sample_markdown_file(tmp_path):
+    """Write the sample task to a file for the tests that need a real path."""
+    task_path = tmp_path / "test_task.md"
+    task_path.write_text(SAMPLE_MARKDOWN, encoding='utf-8')
+    return task_path
 
 
-def test_add_execution_info(test_task_file):
-    """Test adding execution info to tasks."""
-    with open(test_task_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    updated = add_execution_info(content)
-    
-    # Verify execution info was added (this is more complex and depends on implementation)
-    assert "**Execution Mode**" in updated
+@pytest.fixture(scope="module")
+def missing_sections(sample_markdown):
+    """Scan the sample task for missing sections once and share the result."""
+    return check_required_sections(sample_markdown)
 
 
-def test_amend_task_list_integration(test_task_file):
-    """Test the complete amend_task_list function."""
-    output_path = str(test_task_file) + ".amended"
-    
-    # Amend the task
-    amended_content = amend_task_list(str(test_task_file), output_path)
-    
-    # Verify output file was created
-    assert os.path.exists(output_path)
-    
-    # Read output file
-    with open(output_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+@pytest.fixture(scope="module")
+def amended_once(sample_markdown):
+    """Amend the sample task in memory once; tests of the final state share it."""
+    return amend_task_content(sample_markdown)
+
+
+def test_check_required_sections(missing_sections):
+    """Test that every required section is reported missing from the sample."""
+    missing = _missing_markers(missing_sections)
+    assert not missing, f"not reported: {missing}"
+
+
+def test_add_missing_sections(sample_markdown, missing_sections):
+    """Test adding the missing sections to the sample."""
+    result = add_missing_sections(sample_markdown, missing_sections)
+    missing = _missing_markers(result)
+    assert not missing, f"missing: {missing}"
+
+
+def test_ensure_status_markers(sample_markdown):
+    """Test adding status markers to the task and subtask headers."""
+    result = ensure_status_markers(sample_markdown)
+    assert "# Task 999: Test Task ⏳ Not Started" in result
+    assert "### Task 1: Test Subtask ⏳ Not Started" in result
+
+
+def test_ensure_checkboxes(sample_markdown):
+    """Test turning steps into checkboxes."""
+    result = ensure_checkboxes(sample_markdown)
+    assert "- [ ] Step 1: Do something" in result
+    assert "- [ ] Step 2: Do something else" in result
+
+
+def test_add_execution_info(sample_markdown):
+    """Test adding the execution mode to the sample."""
+    result = add_execution_info(sample_markdown)
+    assert "**Execution Mode**" in result
+
+
+def test_amend_task_content(amended_once):
+    """Test the final state of a fully amended task."""
     # Verify all required sections are present
-    assert "**Objective**" in content
-    assert "**Requirements**" in content
-    assert "## Overview" in content
-    assert "## Usage Table" in content
-    assert "## Version Control Plan" in content
-    assert "## Resources" in content
-    assert "## Progress Tracking" in content
-    assert "## Report Documentation Requirements" in content
+    missing = _missing_markers(amended_once)
+    assert not missing, f"missing: {missing}"
     
     # Verify status markers
-    assert "# Task 999: Test Task ⏳ Not Started" in content
-    assert "### Task 1: Test Subtask ⏳ Not Started" in content
+    assert "# Task 999: Test Task ⏳ Not Started" in amended_once
+    assert "### Task 1: Test Subtask ⏳ Not Started" in amended_once
     
     # Verify execution mode
-    assert "**Execution Mode**" in content
+    assert "**Execution Mode**" in amended_once
     
     # Verify checkboxes
-    assert "- [ ] Step 1:" in content
-    assert "- [ ] Step 2:" in content
-    
-    # Clean up
-    os.unlink(output_path)
+    assert "- [ ] Step 1:" in amended_once
+    assert "- [ ] Step 2:" in amended_once
 
 
-if __name__ == "__main__":
-    import sys
+def test_amend_task_list_integration(sample_markdown_file, amended_once, tmp_path):
+    """Test the complete amend_task_list function."""
+    output_path = tmp_path / "test_task.md.amended"
     
-    # Track validation failures
-    all_validation_failures = []
-    total_tests = 0
+    # Amend the task
+    amended_content = amend_task_list(str(sample_markdown_file), str(output_path))
     
-    # Test check_required_sections
-    total_tests += 1
-    try:
-        # Create a temporary test file
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.md', delete=False) as f:
-            f.write("# Task 999: Test Task\n\nThis is a test task with missing sections.")
-        
-        # Test the function
-        with open(f.name, 'r') as file:
-            content = file.read()
-        
-        missing = check_required_sections(content)
-        assert "**Objective**" in missing
-        assert "**Requirements**" in missing
-        assert "## Overview" in missing
-        
-        # Clean up
-        os.unlink(f.name)
-    except Exception as e:
-        all_validation_failures.append(f"check_required_sections test failed: {str(e)}")
+    # Amending the file gives the same result as amending its content, which
+    # the sample's missing sections guarantee is not the original text
+    assert amended_content == amended_once
+    assert amended_content != SAMPLE_MARKDOWN
     
-    # Test amend_task_list
-    total_tests += 1
+    # Verify the output file holds the returned content; reading it also
+    # checks that it exists
     try:
-        # Create a temporary test file
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.md', delete=False) as f:
-            f.write("# Task 999: Test Task\n\nThis is a test task with missing sections.")
-        
-        # Test the function
-        output_path = f.name + ".amended"
-        amend_task_list(f.name, output_path)
-        
-        # Verify output file exists and has required sections
-        assert os.path.exists(output_path)
-        with open(output_path, 'r') as file:
-            content = file.read()
-        
-        assert "**Objective**" in content
-        assert "**Requirements**" in content
-        assert "## Overview" in content
-        
-        # Clean up
-        os.unlink(f.name)
-        os.unlink(output_path)
-    except Exception as e:
-        all_validation_failures.append(f"amend_task_list test failed: {str(e)}")
-    
-    # Final validation result
-    if all_validation_failures:
-        print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
-        for failure in all_validation_failures:
-            print(f"  - {failure}")
-        sys.exit(1)
-    else:
-        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
-        print("Function is validated and formal tests can now be written")
-        sys.exit(0)
\ No newline at end of file
+        written = output_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        pytest.fail(f"Output file {output_path} was not created")
+    assert written == amended_content
+
+
+if __name__ == "__main__":
+    # The pytest tests above are the validation; run them when executed directly
+    raise SystemExit(pytest.main([__file__]))
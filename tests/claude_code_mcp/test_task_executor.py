@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Task Executor module.
+
+This test suite validates dependency-based scheduling (critical-path order,
+exclusive sequential subtasks and cancellation after a failure), the
+replay of the status journal onto an unfinished task, and the choice between
+starting a command directly and through /bin/sh.
+
+Documentation:
+- pytest: https://docs.pytest.org/
+- Task Executor: See src/claude_code_mcp/task_executor.py
+
+Sample Input:
+  Subtasks with dependencies and execution modes
+
+Expected Output:
+  Subtasks started in rank order, with statuses recorded per subtask
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+from claude_code_mcp.task_executor import TaskExecutor
+
+
+def _subtask(subtask_id, dependencies=(), mode="parallel"):
+    return {"id": subtask_id, "dependencies": list(dependencies), "executionMode": mode}
+
+
+def _run_task(executor, subtasks, run):
+    """Execute a task whose subtasks are carried out by run(subtask_id)."""
+    async def execute_subtask(subtask):
+        return {"output": await run(subtask["id"])}
+
+    executor._execute_subtask = execute_subtask
+    task_data = {"id": "task-test", "executionMode": "parallel", "subtasks": subtasks}
+    return asyncio.run(executor.execute_task(task_data))
+
+
+def _statuses(result):
+    return {subtask["id"]: subtask["status"] for subtask in result["subtasks"]}
+
+
+def test_longest_chain_starts_first(tmp_path):
+    """Test that ready subtasks start longest remaining chain first."""
+    executor = TaskExecutor(storage_dir=tmp_path, max_parallel=1)
+    started = []
+
+    async def run(subtask_id):
+        started.append(subtask_id)
+        return subtask_id
+
+    subtasks = [
+        _subtask("side"),
+        _subtask("chain-1"),
+        _subtask("chain-2", ["chain-1"]),
+        _subtask("chain-3", ["chain-2"]),
+    ]
+    result = _run_task(executor, subtasks, run)
+
+    # chain-1 leads a chain of three; once chain-2 is done, side and chain-3
+    # have the same rank and the declared order breaks the tie
+    assert started == ["chain-1", "chain-2", "side", "chain-3"]
+    assert result["status"] == "completed"
+
+
+def test_sequential_subtask_runs_alone(tmp_path):
+    """Test that a sequential-mode subtask never overlaps another subtask."""
+    executor = TaskExecutor(storage_dir=tmp_path, max_parallel=8)
+    running = set()
+    overlaps = {}
+
+    async def run(subtask_id):
+        running.add(subtask_id)
+        overlaps[subtask_id] = set(running)
+        await asyncio.sleep(0.01)
+        overlaps[subtask_id] |= running
+        running.discard(subtask_id)
+        return subtask_id
+
+    subtasks = [
+        _subtask("parallel-1"),
+        _subtask("parallel-2"),
+        _subtask("alone", mode="sequential"),
+        _subtask("parallel-3"),
+    ]
+    result = _run_task(executor, subtasks, run)
+
+    assert overlaps["alone"] == {"alone"}
+    assert {"parallel-1", "parallel-2"} <= overlaps["parallel-1"]
+    assert set(_statuses(result).values()) == {"completed"}
+
+
+def test_failure_cancels_dependents(tmp_path):
+    """Test that a failed subtask cancels its dependents but not other branches."""
+    executor = TaskExecutor(storage_dir=tmp_path)
+
+    async def run(subtask_id):
+        if subtask_id == "fails":
+            raise RuntimeError("boom")
+        return subtask_id
+
+    subtasks = [
+        _subtask("fails"),
+        _subtask("child", ["fails"]),
+        _subtask("grandchild", ["child"]),
+        _subtask("independent"),
+    ]
+    result = _run_task(executor, subtasks, run)
+
+    assert _statuses(result) == {
+        "fails": "failed",
+        "child": "cancelled",
+        "grandchild": "cancelled",
+        "independent": "completed",
+    }
+    assert result["subtasks"][0]["error"] == "boom"
+    assert not (tmp_path / "task-test.jsonl").exists()
+
+
+def _write_status(tmp_path, end_time):
+    status = {
+        "taskId": "task-test",
+        "status": "running",
+        "subtasks": [
+            {"id": "first", "status": "pending"},
+            {"id": "second", "status": "pending"},
+        ],
+        "executionMode": "parallel",
+        "startTime": "2025-05-20T10:15:30",
+        "endTime": end_time,
+    }
+    (tmp_path / "task-test.json").write_bytes(orjson.dumps(status))
+    journal = [
+        {"subtask_id": "first", "status": "running", "ts": 1},
+        {"subtask_id": "first", "status": "completed", "ts": 2, "output": "done"},
+        {"subtask_id": "second", "status": "failed", "ts": 3, "error": "boom"},
+        {"subtask_id": "unknown", "status": "completed", "ts": 4},
+    ]
+    lines = b"".join(orjson.dumps(entry) + b"\n" for entry in journal)
+    # The last line is still being written
+    (tmp_path / "task-test.jsonl").write_bytes(lines + b'{"subtask_id": "sec')
+
+
+def test_journal_replayed_onto_unfinished_status(tmp_path):
+    """Test that journaled changes are applied to a task that has not finished."""
+    _write_status(tmp_path, end_time=None)
+    status = TaskExecutor(storage_dir=tmp_path).read_task_status("task-test")
+
+    assert status["subtasks"] == [
+        {"id": "first", "status": "completed", "output": "done"},
+        {"id": "second", "status": "failed", "error": "boom"},
+    ]
+
+
+def test_journal_ignored_once_finished(tmp_path):
+    """Test that the final status file is used as is once the task has ended."""
+    _write_status(tmp_path, end_time="2025-05-20T10:15:32")
+    status = TaskExecutor(storage_dir=tmp_path).read_task_status("task-test")
+
+    assert [subtask["status"] for subtask in status["subtasks"]] == ["pending", "pending"]
+
+
+def _spawned_via(monkeypatch, executor, command):
+    """Run a command subtask and return how it was started ("shell" or "exec")."""
+    spawned = []
+    for kind in ("shell", "exec"):
+        original = getattr(asyncio, f"create_subprocess_{kind}")
+
+        def spy(*args, _kind=kind, _original=original, **kwargs):
+            spawned.append(_kind)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(asyncio, f"create_subprocess_{kind}", spy)
+    result = asyncio.run(executor._execute_subtask({"command": command}))
+    assert result["exitCode"] == 0
+    return spawned, result["output"]
+
+
+@pytest.mark.parametrize(
+    "command", ["cd /", "export CLAUDE_MCP_TEST", "umask", "command -v sh", "type sh"]
+)
+def test_builtin_commands_use_the_shell(monkeypatch, tmp_path, command):
+    """Test that a command starting with a shell builtin runs in /bin/sh."""
+    spawned, _ = _spawned_via(monkeypatch, TaskExecutor(storage_dir=tmp_path), command)
+    assert spawned == ["shell"]
+
+
+def test_plain_commands_skip_the_shell(monkeypatch, tmp_path):
+    """Test that a plain word list is started without a shell."""
+    spawned, output = _spawned_via(monkeypatch, TaskExecutor(storage_dir=tmp_path), "echo cd")
+    assert spawned == ["exec"]
+    assert output == "cd\n"
+
+
+def test_command_builtin_through_executor(tmp_path):
+    """Test that `command -v sh` runs as a subtask of a task."""
+    executor = TaskExecutor(storage_dir=tmp_path)
+    task_data = {"id": "task-test", "subtasks": [{"id": "which", "command": "command -v sh"}]}
+    result = asyncio.run(executor.execute_task(task_data))
+
+    subtask = result["subtasks"][0]
+    assert subtask["status"] == "completed", subtask.get("error")
+    assert subtask["output"].strip().endswith("/sh")
+
+
+def test_unknown_bare_name_falls_back_to_the_shell(monkeypatch, tmp_path):
+    """Test that a bare name with no executable is retried through /bin/sh."""
+    executor = TaskExecutor(storage_dir=tmp_path)
+    monkeypatch.setattr("claude_code_mcp.task_executor._SHELL_BUILTINS", frozenset())
+    spawned, output = _spawned_via(monkeypatch, executor, "command -v sh")
+    assert spawned == ["exec", "shell"]
+    assert output.strip().endswith("/sh")
+
+
+def test_missing_path_is_not_retried(tmp_path):
+    """Test that a command given by path that does not exist fails without the shell."""
+    executor = TaskExecutor(storage_dir=tmp_path)
+    with pytest.raises(RuntimeError, match="could not be started"):
+        asyncio.run(executor._execute_subtask({"command": "/nonexistent/tool --flag"}))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))